@@ -170,8 +170,7 @@ class Queue(base.AMQPClass):
         :return: bool
 
         """
-        if hasattr(source, 'name'):
-            source = source.name
+        source = getattr(source, 'name', source)
         frame = specification.Queue.Bind(queue=self.name,
                                          exchange=source,
                                          routing_key=routing_key or '',
@@ -358,8 +357,7 @@ class Queue(base.AMQPClass):
         :param str routing_key: The routing key that binds them
 
         """
-        if hasattr(source, 'name'):
-            source = source.name
+        source = getattr(source, 'name', source)
         routing_key = routing_key or self.name
         self._rpc(specification.Queue.Unbind(queue=self.name, exchange=source,
                                              routing_key=routing_key))
@@ -0,0 +1,138 @@
+"""
+An opt-in :mod:`asyncio` facade over the blocking
+:class:`~rabbitpy.connection.Connection` and
+:class:`~rabbitpy.channel.Channel` objects, allowing applications that are
+already running an event loop to use rabbitpy without blocking it.
+
+"""
+import asyncio
+from concurrent import futures
+import logging
+
+from rabbitpy.connection import Connection
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = ['AsyncConnection', 'Connection']
+
+
+class AsyncConnection(object):
+    """Wraps a :class:`~rabbitpy.connection.Connection`, running the blocking
+    calls in a private single worker thread so that the event loop is not
+    blocked while waiting on RabbitMQ. All calls for a connection are
+    serialized on the same worker thread.
+
+    .. code:: python
+
+        async with rabbitpy.asyncio.AsyncConnection(url) as conn:
+            channel = await conn.channel()
+            message = rabbitpy.Message(channel, 'Hello World')
+            await conn.publish(message, 'amq.topic', 'test.key')
+
+    :param str url: The AMQP connection URL
+
+    """
+    def __init__(self, url=None):
+        self._url = url
+        self._connection = None
+        self._executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._lock = None
+
+    async def __aenter__(self):
+        """For use as an async context manager, open the connection and
+        return a handle to this object instance.
+
+        :rtype: AsyncConnection
+
+        """
+        try:
+            await self.open()
+        except Exception:
+            self._executor.shutdown(wait=False)
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """When leaving the context, close the connection, letting any
+        exception that was raised propagate.
+
+        :rtype: bool
+
+        """
+        if exc_type:
+            try:
+                if self._connection is not None:
+                    await self._run(self._connection.__exit__,
+                                    exc_type, exc_val, exc_tb)
+            finally:
+                self._executor.shutdown(wait=False)
+            return False
+        await self.close()
+        return False
+
+    @property
+    def connection(self):
+        """Return the underlying blocking connection.
+
+        :rtype: rabbitpy.connection.Connection
+
+        """
+        return self._connection
+
+    async def open(self):
+        """Connect to RabbitMQ, negotiating the connection.
+
+        :raises: rabbitpy.exceptions.ConnectionException
+
+        """
+        self._connection = await self._run(Connection, self._url)
+
+    async def channel(self, blocking_read=False):
+        """Create a new channel on the connection.
+
+        :param bool blocking_read: Enable for higher throughput
+        :rtype: rabbitpy.channel.Channel
+
+        """
+        return await self._run(self._connection.channel, blocking_read)
+
+    async def publish(self, message, exchange, routing_key='',
+                      mandatory=False):
+        """Publish the message to the exchange with the specified routing
+        key, returning the publisher confirmation result if enabled.
+
+        :param rabbitpy.message.Message message: The message to publish
+        :param exchange: The exchange to publish the message to
+        :type exchange: str or :class:`rabbitpy.Exchange`
+        :param str routing_key: The routing key to use
+        :param bool mandatory: Requires the message is published
+        :return: bool or None
+
+        """
+        return await self._run(message.publish, exchange, routing_key,
+                               mandatory)
+
+    async def close(self):
+        """Close the connection, including all open channels, and shutdown
+        the worker thread.
+
+        """
+        try:
+            if self._connection is not None:
+                await self._run(self._connection.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def _run(self, method, *args):
+        """Run the blocking method in the connection's worker thread.
+
+        :param method: The method to invoke
+        :type method: typing.Callable
+        :param list args: Args to pass to the method
+
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, method, *args)
@@ -5,6 +5,7 @@ Base classes for various parts of rabbitpy
 import logging
 import threading
 
+from pamqp import frame as pamqp_frame
 from pamqp import specification
 
 from rabbitpy import exceptions
@@ -242,8 +243,9 @@ class AMQPChannel(StatefulObject):
                                     specification.Basic.Nack])
 
     def write_frame(self, frame):
-        """Put the frame in the write queue for the IOWriter object to write to
-        the socket when it can. This should not be directly invoked.
+        """Marshal the frame and put it in the write queue for the IO thread
+        to write to the socket when it can. This should not be directly
+        invoked.
 
         :param pamqp.specification.Frame frame: The frame to write
 
@@ -251,13 +253,14 @@ class AMQPChannel(StatefulObject):
         if self._can_write():
             if self._is_debugging:
                 LOGGER.debug('Writing frame: %s', frame.name)
+            value = pamqp_frame.marshal(frame, self._channel_id)
             with self._write_lock:
-                self._write_queue.put((self._channel_id, frame))
+                self._write_queue.append(value)
             self._trigger_write()
 
     def write_frames(self, frames):
-        """Add a list of frames for the IOWriter object to write to the socket
-        when it can.
+        """Marshal a list of frames and add them for the IO thread to write to
+        the socket when it can.
 
         :param list frames: The list of frame to write
 
@@ -266,10 +269,10 @@ class AMQPChannel(StatefulObject):
             if self._is_debugging:
                 LOGGER.debug('Writing frames: %r',
                              [frame.name for frame in frames])
+            values = [pamqp_frame.marshal(frame, self._channel_id)
+                      for frame in frames]
             with self._write_lock:
-                # pylint: disable=expression-not-assigned
-                [self._write_queue.put((self._channel_id, frame))
-                 for frame in frames]
+                self._write_queue.extend(values)
             self._trigger_write()
 
     def _build_close_frame(self):
@@ -283,10 +286,8 @@ class AMQPChannel(StatefulObject):
 
     def _can_write(self):
         self._check_for_exceptions()
-        if self._connection.closed:
-            raise exceptions.ConnectionClosed()
-        elif self.closed:
-            raise exceptions.ChannelClosedException()
+        if self._connection.closed or self.closed:
+            self._raise_closed()
         return True
 
     @property
@@ -374,15 +375,28 @@ class AMQPChannel(StatefulObject):
 
         """
         self._set_state(self.REMOTE_CLOSED)
-        if value.reply_code in exceptions.AMQP:
+        exception_class = exceptions.lookup(value.reply_code)
+        if exception_class is not None:
             LOGGER.error('Received remote close (%s): %s',
                          value.reply_code, value.reply_text)
-            raise exceptions.AMQP[value.reply_code](value)
+            raise exception_class(value)
         else:
             raise exceptions.RemoteClosedChannelException(self._channel_id,
                                                           value.reply_code,
                                                           value.reply_text)
 
+    def _raise_closed(self):
+        """Raise the exception for writing to a closed connection or channel,
+        kept out of :meth:`_can_write` so the common path stays small.
+
+        :raises: rabbitpy.exceptions.ConnectionClosed
+        :raises: rabbitpy.exceptions.ChannelClosedException
+
+        """
+        if self._connection.closed:
+            raise exceptions.ConnectionClosed()
+        raise exceptions.ChannelClosedException()
+
     def _read_from_queue(self):
         """Check to see if a frame is in the queue and if so, return it
 
@@ -50,8 +50,8 @@ class Channel(base.AMQPChannel):
     :type exception_queue: queue.Queue
     :param read_queue: Queue to read pending frames from
     :type read_queue: queue.Queue
-    :param write_queue: Queue to write pending AMQP objs to
-    :type write_queue: queue.Queue
+    :param write_queue: Queue to write pending marshalled frames to
+    :type write_queue: collections.deque
     :param int maximum_frame_size: The max frame size for msg bodies
     :param socket write_trigger: Write to this socket to break IO waiting
     :param bool blocking_read: Use blocking Queue.get to improve performance
@@ -75,6 +75,8 @@ class Channel(base.AMQPChannel):
         self._events = events
         self._maximum_frame_size = maximum_frame_size
         self._publisher_confirms = False
+        self._publish_sequence = 0
+        self._unconfirmed = set()
         self._read_queue = read_queue
         self._write_queue = write_queue
         self._server_capabilities = server_capabilities
@@ -153,6 +155,8 @@ class Channel(base.AMQPChannel):
             raise exceptions.NotSupportedError('Confirm.Select')
         self.rpc(spec.Confirm.Select())
         self._publisher_confirms = True
+        self._publish_sequence = 0
+        self._unconfirmed = set()
 
     @property
     def id(self):  # pylint: disable=invalid-name
@@ -206,6 +210,40 @@ class Channel(base.AMQPChannel):
             return
         self.rpc(spec.Basic.Qos(prefetch_size=value, global_=all_channels))
 
+    def publish_many(self, messages, exchange, routing_key='',
+                     mandatory=False, immediate=False):
+        """Publish multiple messages to the exchange with the specified
+        routing key, adding all of the frames to the write queue at once.
+
+        If publisher confirmations are enabled, the method will wait for all
+        of the messages to be confirmed, returning ``False`` if any of them
+        were negatively acknowledged by RabbitMQ.
+
+        :param messages: The messages to publish
+        :type messages: list or iterable
+        :param exchange: The exchange to publish the messages to
+        :type exchange: str or :class:`rabbitpy.Exchange`
+        :param str routing_key: The routing key to use
+        :param bool mandatory: Requires the messages are published
+        :param bool immediate: Request immediate delivery
+        :return: bool or None
+        :raises: rabbitpy.exceptions.MessageReturnedException
+
+        """
+        # Materialize the messages so they can be counted before any of the
+        # frames are written
+        messages = list(messages)
+        frames = []
+        for msg in messages:
+            # pylint: disable=protected-access
+            frames += msg._publish_frames(exchange, routing_key,
+                                          mandatory, immediate)
+        first_tag = self._publish_sequence + 1
+        self.write_frames(frames)
+        if self._publisher_confirms:
+            return self._wait_for_confirmations(
+                range(first_tag, first_tag + len(messages)))
+
     @property
     def publisher_confirms(self):
         """Returns True if publisher confirms are enabled.
@@ -224,6 +262,40 @@ class Channel(base.AMQPChannel):
         """
         self.rpc(spec.Basic.Recover(requeue=requeue))
 
+    def wait_for_confirmation(self):
+        """Used by the Message.publish method when publisher confirmations are
+        enabled, removing the delivery tags that the confirmation covers from
+        the set of unconfirmed delivery tags.
+
+        :rtype: pamqp.frame.Frame
+
+        """
+        response = super(Channel, self).wait_for_confirmation()
+        if isinstance(response, (spec.Basic.Ack, spec.Basic.Nack)):
+            if response.multiple:
+                self._unconfirmed = {tag for tag in self._unconfirmed
+                                     if tag > response.delivery_tag}
+            else:
+                self._unconfirmed.discard(response.delivery_tag)
+        return response
+
+    def write_frames(self, frames):
+        """Add a list of frames for the IO thread to write to the socket when
+        it can, assigning the publisher confirmation delivery tags for any
+        messages being published when publisher confirmations are enabled.
+
+        :param list frames: The list of frame to write
+
+        """
+        super(Channel, self).write_frames(frames)
+        if self._publisher_confirms:
+            count = sum(1 for frame_value in frames
+                        if isinstance(frame_value, spec.Basic.Publish))
+            self._unconfirmed.update(
+                range(self._publish_sequence + 1,
+                      self._publish_sequence + count + 1))
+            self._publish_sequence += count
+
     @staticmethod
     def _build_open_frame():
         """Build and return a channel open frame
@@ -250,8 +322,7 @@ class Channel(base.AMQPChannel):
         LOGGER.debug('Cancelling consumer while %r (%r)',
                      self.state_description,
                      self._connection.state_description)
-        if consumer_tag in self._consumers:
-            del self._consumers[consumer_tag]
+        self._consumers.pop(consumer_tag, None)
         if nowait:
             self.write_frame(spec.Basic.Cancel(consumer_tag=consumer_tag,
                                                nowait=True))
@@ -273,8 +344,7 @@ class Channel(base.AMQPChannel):
                                                       value.routing_key)
         elif isinstance(value, spec.Basic.Cancel):
             self._waiting = False
-            if value.consumer_tag in self._consumers:
-                del self._consumers[value.consumer_tag]
+            self._consumers.pop(value.consumer_tag, None)
             raise exceptions.RemoteCancellationException(value.consumer_tag)
 
     def _consume(self, obj, no_ack, priority=None):
@@ -442,6 +512,29 @@ class Channel(base.AMQPChannel):
         """
         return self._server_capabilities.get('publisher_confirms', False)
 
+    def _wait_for_confirmations(self, delivery_tags):
+        """Wait for RabbitMQ to confirm all of the specified delivery tags,
+        in any order, returning ``False`` if any of them were negatively
+        acknowledged.
+
+        :param delivery_tags: The delivery tags to wait on
+        :type delivery_tags: range
+        :rtype: bool
+        :raises: rabbitpy.exceptions.UnexpectedResponseError
+
+        """
+        result = True
+        pending = set(delivery_tags)
+        while pending:
+            response = self.wait_for_confirmation()
+            if not isinstance(response, (spec.Basic.Ack, spec.Basic.Nack)):
+                raise exceptions.UnexpectedResponseError(response)
+            confirmed = pending - self._unconfirmed
+            if confirmed and isinstance(response, spec.Basic.Nack):
+                result = False
+            pending -= confirmed
+        return result
+
     def _wait_for_content_frames(self, method_frame):
         """Used by both Channel._get_message and Channel._consume_message for
         getting a message parts off the queue and returning the fully
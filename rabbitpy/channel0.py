@@ -31,8 +31,8 @@ class Channel0(base.AMQPChannel):
     :type events_obj: rabbitpy.events.Events
     :param exception_queue: The queue where any pending exceptions live
     :type exception_queue: queue.Queue
-    :param write_queue: The queue to place data to write in
-    :type write_queue: queue.Queue
+    :param write_queue: The queue to place marshalled frames to write in
+    :type write_queue: collections.deque
     :param write_trigger: The socket to write to, to trigger IO writes
     :type write_trigger: socket.socket
 
@@ -106,8 +106,9 @@ class Channel0(base.AMQPChannel):
             self._events.set(events.SOCKET_CLOSED)
             self._events.set(events.CHANNEL0_CLOSED)
             self._connection.close()
-            if value.reply_code in exceptions.AMQP:
-                err = exceptions.AMQP[value.reply_code](value.reply_text)
+            exception_class = exceptions.lookup(value.reply_code)
+            if exception_class is not None:
+                err = exception_class(value.reply_text)
             else:
                 err = exceptions.RemoteClosedException(value.reply_code,
                                                        value.reply_text)
@@ -2,6 +2,7 @@
 The Connection class negotiates and manages the connection state.
 
 """
+import collections
 import logging
 # pylint: disable=import-error
 try:
@@ -112,8 +113,10 @@ class Connection(base.StatefulObject):
         # A queue for the child threads to put exceptions in
         self._exceptions = queue.Queue()
 
-        # One queue for writing frames, regardless of the channel sending them
-        self._write_queue = queue.Queue()
+        # One queue of marshalled frames to write, regardless of the channel
+        # sending them, appended to by the channels and drained by the IO
+        # thread without additional locking
+        self._write_queue = collections.deque()
 
         # Lock used when managing the channel stack
         self._channel_lock = threading.Lock()
@@ -141,12 +144,17 @@ class Connection(base.StatefulObject):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """When leaving the context, examine why the context is leaving, if
-        it's an exception or what.
+        it's an exception or what. If an exception is being raised, the
+        connection is torn down without the AMQP close handshake and the
+        exception is allowed to propagate.
+
+        :rtype: bool
 
         """
-        if exc_type and exc_val:
+        if exc_type:
             self._set_state(self.CLOSED)
-            raise exc_val
+            self._shutdown_connection(True)
+            return False
         self.close()
 
     @property
@@ -557,11 +565,12 @@ class Connection(base.StatefulObject):
         validation = self._qargs_mk_value(['verify', 'ssl_validation'], values)
         if not validation:
             return
-        elif validation not in SSL_CERT_MAP:
+        value = SSL_CERT_MAP.get(validation)
+        if value is None:
             raise ValueError(
                 'Unsupported server cert validation option: %s',
                 validation)
-        return SSL_CERT_MAP[validation]
+        return value
 
     def _qargs_ssl_version(self, values):
         """Return the value mapped from the string value in the query string
@@ -574,9 +583,10 @@ class Connection(base.StatefulObject):
         version = self._qargs_value('ssl_version', values)
         if not version:
             return
-        elif version not in SSL_VERSION_MAP:
+        value = SSL_VERSION_MAP.get(version)
+        if value is None:
             raise ValueError('Unuspported SSL version: %s' % version)
-        return SSL_VERSION_MAP[version]
+        return value
 
     @staticmethod
     def _qargs_value(key, values, default=None):
@@ -605,8 +615,12 @@ class Connection(base.StatefulObject):
                 return value
         return None
 
-    def _shutdown_connection(self):
-        """Tell Channel0 and IO to stop if they are not stopped.
+    def _shutdown_connection(self, force=False):
+        """Tell Channel0 and IO to stop if they are not stopped. If ``force``
+        is set, the channels are not closed via RPC prior to closing the
+        socket.
+
+        :param bool force: Skip closing the channels before closing the socket
 
         """
         # Make sure the heartbeat is not running
@@ -614,7 +628,8 @@ class Connection(base.StatefulObject):
             self._heartbeat.stop()
 
         if not self._events.is_set(events.SOCKET_CLOSED):
-            self._close_all_channels()
+            if not force:
+                self._close_all_channels()
 
             # Let the IOLoop know to close
             self._events.set(events.SOCKET_CLOSE)
@@ -631,8 +646,9 @@ class Connection(base.StatefulObject):
         else:
             return self._io.stop()
 
-        while self._io.is_alive():
-            time.sleep(0.1)
+        self._io.join(self._args['timeout'])
+        if self._io.is_alive():
+            LOGGER.warning('Timed out waiting for the IO thread to exit')
 
     def _trigger_write(self):
         """Notifies the IO loop we need to write a frame by writing a byte
@@ -72,15 +72,16 @@ class Events(object):
         :rtype: bool
 
         """
-        if event_id not in self._events:
+        event = self._events.get(event_id)
+        if event is None:
             LOGGER.debug('Event does not exist: %s', description(event_id))
             return None
 
-        if not self.is_set(event_id):
+        if not event.is_set():
             LOGGER.debug('Event is not set: %s', description(event_id))
             return False
 
-        self._events[event_id].clear()
+        event.clear()
         return True
 
     def is_set(self, event_id):
@@ -91,10 +92,11 @@ class Events(object):
         :rtype: bool
 
         """
-        if event_id not in self._events:
+        event = self._events.get(event_id)
+        if event is None:
             LOGGER.debug('Event does not exist: %s', description(event_id))
             return None
-        return self._events[event_id].is_set()
+        return event.is_set()
 
     def set(self, event_id):
         """Trigger an event to fire. Returns bool indicating success in firing
@@ -104,15 +106,16 @@ class Events(object):
         :rtype: bool
 
         """
-        if event_id not in self._events:
+        event = self._events.get(event_id)
+        if event is None:
             LOGGER.debug('Event does not exist: %s', description(event_id))
             return None
 
-        if self.is_set(event_id):
+        if event.is_set():
             LOGGER.debug('Event is already set: %s', description(event_id))
             return False
 
-        self._events[event_id].set()
+        event.set()
         return True
 
     def wait(self, event_id, timeout=1):
@@ -125,9 +128,10 @@ class Events(object):
         :param float timeout: The number of seconds to wait
 
         """
-        if event_id not in self._events:
+        event = self._events.get(event_id)
+        if event is None:
             LOGGER.debug('Event does not exist: %s', description(event_id))
             return None
         LOGGER.debug('Waiting for %i seconds on event: %s',
                      timeout, description(event_id))
-        return self._events[event_id].wait(timeout)
+        return event.wait(timeout)
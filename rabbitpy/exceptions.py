@@ -3,16 +3,83 @@ Exceptions that may be raised by rabbitpy during use
 ----------------------------------------------------
 
 """
+import sys
+import types
+
+__all__ = [
+    'AMQP',
+    'detach',
+    'lookup',
+    'RabbitpyException',
+    'AMQPException',
+    'ActionException',
+    'ChannelClosedException',
+    'ConnectionException',
+    'ConnectionClosed',
+    'ConnectionResetException',
+    'RemoteCancellationException',
+    'RemoteClosedChannelException',
+    'RemoteClosedException',
+    'MessageReturnedException',
+    'NoActiveTransactionError',
+    'NotConsumingError',
+    'NotSupportedError',
+    'TooManyChannelsError',
+    'UnexpectedResponseError',
+    'AMQPContentTooLarge',
+    'AMQPNoRoute',
+    'AMQPNoConsumers',
+    'AMQPAccessRefused',
+    'AMQPNotFound',
+    'AMQPResourceLocked',
+    'AMQPPreconditionFailed',
+    'AMQPConnectionForced',
+    'AMQPInvalidPath',
+    'AMQPFrameError',
+    'AMQPSyntaxError',
+    'AMQPCommandInvalid',
+    'AMQPChannelError',
+    'AMQPUnexpectedFrame',
+    'AMQPResourceError',
+    'AMQPNotAllowed',
+    'AMQPNotImplemented',
+    'AMQPInternalError'
+]
 
 
 class RabbitpyException(Exception):
     """Base exception of all rabbitpy exceptions."""
-    pass
+    __slots__ = ('_message',)
+
+    def __str__(self):
+        """Return the exception message, formatting it only the first time it
+        is requested.
+
+        :rtype: str
+
+        """
+        try:
+            return self._message
+        except AttributeError:
+            self._message = self._format()
+        return self._message
+
+    def _format(self):
+        """Return the exception message built from the exception arguments,
+        overridden by exceptions that format a specific message.
+
+        :rtype: str
+
+        """
+        return super(RabbitpyException, self).__str__()
 
 
 class AMQPException(RabbitpyException):
-    """Base exception of all AMQP exceptions."""
-    pass
+    """Base exception of all AMQP exceptions. Every exception that is mapped
+    to an AMQP reply code extends this class.
+
+    """
+    __slots__ = ()
 
 
 class ActionException(RabbitpyException):
@@ -22,15 +89,21 @@ class ActionException(RabbitpyException):
     sent by RabbitMQ via an AMQP Basic.Get or Basic.Consume.
 
     """
-    def __str__(self):
-        return self.args[0]
+    __slots__ = ()
+
+    def _format(self):
+        return f'{self.args[0]}'
 
 
 class ChannelClosedException(RabbitpyException):
     """Raised when an action is attempted on a channel that is closed."""
+    __slots__ = ()
+
+    _MESSAGE = sys.intern('Can not perform RPC requests on a closed '
+                          'channel, you must create a new channel')
+
     def __str__(self):
-        return 'Can not perform RPC requests on a closed channel, you must ' \
-               'create a new channel'
+        return self._MESSAGE
 
 
 class ConnectionException(RabbitpyException):
@@ -39,8 +112,14 @@ class ConnectionException(RabbitpyException):
     authentication_failure_close feature added in RabbitMQ 3.2.
 
     """
-    def __str__(self):
-        return 'Unable to connect to the remote server {0}'.format(self.args)
+    __slots__ = ()
+
+    def _format(self):
+        args = self.args
+        if len(args) == 3:
+            return ('Unable to connect to the remote server '
+                    f'{args[0]}:{args[1]} ({args[2]})')
+        return 'Unable to connect to the remote server'
 
 
 class ConnectionClosed(ConnectionException):
@@ -48,8 +127,12 @@ class ConnectionClosed(ConnectionException):
     open.
 
     """
+    __slots__ = ()
+
+    _MESSAGE = sys.intern('The connection is closed')
+
     def __str__(self):
-        return 'The connection is closed'
+        return self._MESSAGE
 
 
 class ConnectionResetException(ConnectionException):
@@ -58,44 +141,90 @@ class ConnectionResetException(ConnectionException):
     missed heartbeat intervals if heartbeats are enabled.
 
     """
+    __slots__ = ()
+
+    _MESSAGE = sys.intern('Connection was reset at socket level')
+
     def __str__(self):
-        return 'Connection was reset at socket level'
+        return self._MESSAGE
 
 
 class RemoteCancellationException(RabbitpyException):
     """Raised if RabbitMQ cancels an active consumer"""
+    __slots__ = ()
+
+    _MESSAGE = sys.intern('Remote server cancelled the active consumer')
+
     def __str__(self):
-        return 'Remote server cancelled the active consumer'
+        return self._MESSAGE
 
 
 class RemoteClosedChannelException(RabbitpyException):
     """Raised if RabbitMQ closes the channel and the reply_code in the
     Channel.Close RPC request does not have a mapped exception in Rabbitpy.
 
+    :param int channel_id: The channel that was closed
+    :param int reply_code: The reply code sent by RabbitMQ
+    :param str reply_text: The reply text sent by RabbitMQ
+
     """
-    def __str__(self):
-        return 'Channel {0} was closed by the remote server ' \
-               '({1}): {2}'.format(*self.args)
+    __slots__ = ('channel_id', 'reply_code', 'reply_text')
+
+    def __init__(self, channel_id, reply_code, reply_text):
+        super(RemoteClosedChannelException, self).__init__(
+            channel_id, reply_code, reply_text)
+        self.channel_id = channel_id
+        self.reply_code = reply_code
+        self.reply_text = reply_text
+
+    def _format(self):
+        return (f'Channel {self.channel_id} was closed by the remote server '
+                f'({self.reply_code}): {self.reply_text}')
 
 
 class RemoteClosedException(RabbitpyException):
     """Raised if RabbitMQ closes the connection and the reply_code in the
     Connection.Close RPC request does not have a mapped exception in Rabbitpy.
 
+    :param int reply_code: The reply code sent by RabbitMQ
+    :param str reply_text: The reply text sent by RabbitMQ
+
     """
-    def __str__(self):
-        return 'Connection was closed by the remote server ' \
-               '({0}): {1}'.format(*self.args)
+    __slots__ = ('reply_code', 'reply_text')
+
+    def __init__(self, reply_code, reply_text):
+        super(RemoteClosedException, self).__init__(reply_code, reply_text)
+        self.reply_code = reply_code
+        self.reply_text = reply_text
+
+    def _format(self):
+        return ('Connection was closed by the remote server '
+                f'({self.reply_code}): {self.reply_text}')
 
 
 class MessageReturnedException(RabbitpyException):
     """Raised if the RabbitMQ sends a message back to a publisher via
     the Basic.Return RPC call.
 
+    :param int reply_code: The reply code sent by RabbitMQ
+    :param str reply_text: The reply text sent by RabbitMQ
+    :param str exchange: The exchange the message was published to
+    :param str routing_key: The routing key the message was published with
+
     """
-    def __str__(self):
-        return 'Message was returned by RabbitMQ: ({0}) ' \
-               'for exchange {1}'.format(*self.args)
+    __slots__ = ('reply_code', 'reply_text', 'exchange', 'routing_key')
+
+    def __init__(self, reply_code, reply_text, exchange, routing_key):
+        super(MessageReturnedException, self).__init__(
+            reply_code, reply_text, exchange, routing_key)
+        self.reply_code = reply_code
+        self.reply_text = reply_text
+        self.exchange = exchange
+        self.routing_key = routing_key
+
+    def _format(self):
+        return (f'Message was returned by RabbitMQ: ({self.reply_code}) '
+                f'{self.reply_text} for exchange {self.exchange}')
 
 
 class NoActiveTransactionError(RabbitpyException):
@@ -103,8 +232,13 @@ class NoActiveTransactionError(RabbitpyException):
     been initiated.
 
     """
+    __slots__ = ()
+
+    _MESSAGE = sys.intern('No active transaction for the request, '
+                          'channel closed')
+
     def __str__(self):
-        return 'No active transaction for the request, channel closed'
+        return self._MESSAGE
 
 
 class NotConsumingError(RabbitpyException):
@@ -112,8 +246,12 @@ class NotConsumingError(RabbitpyException):
     actively consuming.
 
     """
+    __slots__ = ()
+
+    _MESSAGE = sys.intern('No active consumer to cancel')
+
     def __str__(self):
-        return 'No active consumer to cancel'
+        return self._MESSAGE
 
 
 class NotSupportedError(RabbitpyException):
@@ -121,8 +259,10 @@ class NotSupportedError(RabbitpyException):
     server.
 
     """
-    def __str__(self):
-        return 'The selected feature "{0}" is not supported'.format(self.args)
+    __slots__ = ()
+
+    def _format(self):
+        return f'The selected feature "{self.args[0]}" is not supported'
 
 
 class TooManyChannelsError(RabbitpyException):
@@ -133,8 +273,13 @@ class TooManyChannelsError(RabbitpyException):
     this exception will be raised.
 
     """
+    __slots__ = ()
+
+    _MESSAGE = sys.intern('The maximum amount of negotiated channels has '
+                          'been reached')
+
     def __str__(self):
-        return 'The maximum amount of negotiated channels has been reached'
+        return self._MESSAGE
 
 
 class UnexpectedResponseError(RabbitpyException):
@@ -142,193 +287,136 @@ class UnexpectedResponseError(RabbitpyException):
     back is not recognized.
 
     """
-    def __str__(self):
-        return 'Received an expected response, expected {0}, ' \
-               'received {1}'.format(*self.args)
-
-
-# AMQP Exceptions
-
-
-class AMQPContentTooLarge(AMQPException):
-    """
-    The client attempted to transfer content larger than the server could
-    accept at the present time. The client may retry at a later time.
-
-    """
-    pass
-
-
-class AMQPNoRoute(AMQPException):
-    """
-    Undocumented AMQP Soft Error
-
-    """
-    pass
-
-
-class AMQPNoConsumers(AMQPException):
-    """
-    When the exchange cannot deliver to a consumer when the immediate flag is
-    set. As a result of pending data on the queue or the absence of any
-    consumers of the queue.
-
-    """
-    pass
-
-
-class AMQPAccessRefused(AMQPException):
-    """
-    The client attempted to work with a server entity to which it has no access
-    due to security settings.
-
-    """
-    pass
-
-
-class AMQPNotFound(AMQPException):
-    """
-    The client attempted to work with a server entity that does not exist.
-
-    """
-    pass
-
-
-class AMQPResourceLocked(AMQPException):
-    """
-    The client attempted to work with a server entity to which it has no access
-    because another client is working with it.
-
-    """
-    pass
-
-
-class AMQPPreconditionFailed(AMQPException):
-    """
-    The client requested a method that was not allowed because some
-    precondition failed.
-
-    """
-    pass
-
-
-class AMQPConnectionForced(AMQPException):
-    """
-    An operator intervened to close the connection for some reason. The client
-    may retry at some later date.
-
-    """
-    pass
-
-
-class AMQPInvalidPath(AMQPException):
-    """
-    The client tried to work with an unknown virtual host.
-
-    """
-    pass
-
-
-class AMQPFrameError(AMQPException):
-    """
-    The sender sent a malformed frame that the recipient could not decode. This
-    strongly implies a programming error in the sending peer.
-
-    """
-    pass
-
-
-class AMQPSyntaxError(AMQPException):
-    """
-    The sender sent a frame that contained illegal values for one or more
-    fields. This strongly implies a programming error in the sending peer.
-
-    """
-    pass
-
-
-class AMQPCommandInvalid(AMQPException):
-    """
-    The client sent an invalid sequence of frames, attempting to perform an
-    operation that was considered invalid by the server. This usually implies a
-    programming error in the client.
-
-    """
-    pass
-
-
-class AMQPChannelError(AMQPException):
-    """
-    The client attempted to work with a channel that had not been correctly
-    opened. This most likely indicates a fault in the client layer.
-
-    """
-    pass
-
-
-class AMQPUnexpectedFrame(AMQPException):
-    """
-    The peer sent a frame that was not expected, usually in the context of a
-    content header and body.  This strongly indicates a fault in the peer's
-    content processing.
-
-    """
-    pass
-
-
-class AMQPResourceError(AMQPException):
-    """
-    The server could not complete the method because it lacked sufficient
-    resources. This may be due to the client creating too many of some type of
-    entity.
-
-    """
-    pass
-
-
-class AMQPNotAllowed(AMQPException):
-    """
-    The client tried to work with some entity in a manner that is prohibited by
-    the server, due to security settings or by some other criteria.
-
-    """
-    pass
-
-
-class AMQPNotImplemented(AMQPException):
-    """
-    The client tried to use functionality that is not implemented in the
-    server.
-
-    """
-    pass
-
-
-class AMQPInternalError(AMQPException):
-    """
-    The server could not complete the method because of an internal error. The
-    server may require intervention by an operator in order to resume normal
-    operations.
-
-    """
-    pass
-
-
-AMQP = {311: AMQPContentTooLarge,
-        312: AMQPNoRoute,
-        313: AMQPNoConsumers,
-        320: AMQPConnectionForced,
-        402: AMQPInvalidPath,
-        403: AMQPAccessRefused,
-        404: AMQPNotFound,
-        405: AMQPResourceLocked,
-        406: AMQPPreconditionFailed,
-        501: AMQPFrameError,
-        502: AMQPSyntaxError,
-        503: AMQPCommandInvalid,
-        504: AMQPChannelError,
-        505: AMQPUnexpectedFrame,
-        506: AMQPResourceError,
-        530: AMQPNotAllowed,
-        540: AMQPNotImplemented,
-        541: AMQPInternalError}
+    __slots__ = ()
+
+    def _format(self):
+        args = self.args
+        if len(args) == 2:
+            return ('Received an unexpected response, expected '
+                    f'{args[0]}, received {args[1]}')
+        return f'Received an unexpected response: {args[0]}'
+
+
+# AMQP Exceptions, mapped to the AMQP reply codes that RabbitMQ sends
+# when closing a channel or connection
+
+_AMQP_EXCEPTIONS = [
+    (311, 'AMQPContentTooLarge',
+     'The client attempted to transfer content larger than the server '
+     'could accept at the present time. The client may retry at a later '
+     'time.'),
+    (312, 'AMQPNoRoute',
+     'Undocumented AMQP Soft Error'),
+    (313, 'AMQPNoConsumers',
+     'When the exchange cannot deliver to a consumer when the immediate '
+     'flag is set. As a result of pending data on the queue or the absence '
+     'of any consumers of the queue.'),
+    (320, 'AMQPConnectionForced',
+     'An operator intervened to close the connection for some reason. The '
+     'client may retry at some later date.'),
+    (402, 'AMQPInvalidPath',
+     'The client tried to work with an unknown virtual host.'),
+    (403, 'AMQPAccessRefused',
+     'The client attempted to work with a server entity to which it has no '
+     'access due to security settings.'),
+    (404, 'AMQPNotFound',
+     'The client attempted to work with a server entity that does not '
+     'exist.'),
+    (405, 'AMQPResourceLocked',
+     'The client attempted to work with a server entity to which it has no '
+     'access because another client is working with it.'),
+    (406, 'AMQPPreconditionFailed',
+     'The client requested a method that was not allowed because some '
+     'precondition failed.'),
+    (501, 'AMQPFrameError',
+     'The sender sent a malformed frame that the recipient could not '
+     'decode. This strongly implies a programming error in the sending '
+     'peer.'),
+    (502, 'AMQPSyntaxError',
+     'The sender sent a frame that contained illegal values for one or '
+     'more fields. This strongly implies a programming error in the '
+     'sending peer.'),
+    (503, 'AMQPCommandInvalid',
+     'The client sent an invalid sequence of frames, attempting to perform '
+     'an operation that was considered invalid by the server. This usually '
+     'implies a programming error in the client.'),
+    (504, 'AMQPChannelError',
+     'The client attempted to work with a channel that had not been '
+     'correctly opened. This most likely indicates a fault in the client '
+     'layer.'),
+    (505, 'AMQPUnexpectedFrame',
+     'The peer sent a frame that was not expected, usually in the context '
+     'of a content header and body. This strongly indicates a fault in '
+     "the peer's content processing."),
+    (506, 'AMQPResourceError',
+     'The server could not complete the method because it lacked '
+     'sufficient resources. This may be due to the client creating too '
+     'many of some type of entity.'),
+    (530, 'AMQPNotAllowed',
+     'The client tried to work with some entity in a manner that is '
+     'prohibited by the server, due to security settings or by some other '
+     'criteria.'),
+    (540, 'AMQPNotImplemented',
+     'The client tried to use functionality that is not implemented in the '
+     'server.'),
+    (541, 'AMQPInternalError',
+     'The server could not complete the method because of an internal '
+     'error. The server may require intervention by an operator in order '
+     'to resume normal operations.'),
+]
+
+AMQP = {}
+for _code, _name, _doc in _AMQP_EXCEPTIONS:
+    AMQP[_code] = globals()[_name] = type(
+        _name, (AMQPException,),
+        {'__doc__': _doc, '__module__': __name__, '__slots__': ()})
+del _code, _name, _doc
+
+# The reply code mapping is fixed once built, expose it as read-only
+AMQP = types.MappingProxyType(AMQP)
+
+# Dense lookup table of the AMQP exceptions: a byte per reply code offset
+# holding the position of the exception class in _AMQP_CLASSES
+_AMQP_BASE = min(AMQP)
+_AMQP_CLASSES = tuple(AMQP.values())
+_AMQP_UNMAPPED = 0xFF
+_AMQP_INDEX = bytearray([_AMQP_UNMAPPED]) * (max(AMQP) - _AMQP_BASE + 1)
+for _offset, _code in enumerate(AMQP):
+    _AMQP_INDEX[_code - _AMQP_BASE] = _offset
+_AMQP_INDEX = bytes(_AMQP_INDEX)
+del _code, _offset
+
+
+def detach(exception):
+    """Remove the traceback, cause and context references from an exception
+    so that storing it for later use does not keep the frames and their
+    locals alive.
+
+    :param exception: The exception to detach
+    :type exception: BaseException
+    :rtype: BaseException
+
+    """
+    exception.__traceback__ = None
+    exception.__cause__ = None
+    exception.__context__ = None
+    return exception
+
+
+def lookup(code, default=None):
+    """Return the exception class for the AMQP reply code, or the default
+    value if the reply code does not have a mapped exception. Unlike
+    indexing :data:`AMQP`, an unmapped reply code does not raise a
+    :exc:`KeyError`.
+
+    :param int code: The AMQP reply code
+    :param default: The value to return for an unmapped reply code
+    :rtype: type or None
+
+    """
+    offset = code - _AMQP_BASE
+    if 0 <= offset < len(_AMQP_INDEX):
+        index = _AMQP_INDEX[offset]
+        if index != _AMQP_UNMAPPED:
+            return _AMQP_CLASSES[index]
+    return default
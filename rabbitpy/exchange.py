@@ -30,7 +30,7 @@ class _Exchange(base.AMQPClass):
 
     """
     durable = False
-    arguments = dict()
+    arguments = None
     auto_delete = False
     type = 'direct'
 
@@ -40,7 +40,7 @@ class _Exchange(base.AMQPClass):
         super(_Exchange, self).__init__(channel, name)
         self.durable = durable
         self.auto_delete = auto_delete
-        self.arguments = arguments or dict()
+        self.arguments = arguments or {}
 
     def bind(self, source, routing_key=None):
         """Bind to another exchange with the routing key.
@@ -50,8 +50,7 @@ class _Exchange(base.AMQPClass):
         :param str routing_key: The routing key to use
 
         """
-        if hasattr(source, 'name'):
-            source = source.name
+        source = getattr(source, 'name', source)
         self._rpc(specification.Exchange.Bind(destination=self.name,
                                               source=source,
                                               routing_key=routing_key))
@@ -88,8 +87,7 @@ class _Exchange(base.AMQPClass):
         :param str routing_key: The routing key that binds them
 
         """
-        if hasattr(source, 'name'):
-            source = source.name
+        source = getattr(source, 'name', source)
         self._rpc(specification.Exchange.Unbind(destination=self.name,
                                                 source=source,
                                                 routing_key=routing_key))
@@ -117,8 +115,7 @@ class Exchange(_Exchange):
                                        arguments)
 
 
-class DirectExchange(_Exchange):
-    """The DirectExchange class is used for interacting with direct exchanges
+_TYPED_DOCSTRING = """The {0} class is used for interacting with {1} exchanges
     only.
 
     :param channel: The channel object to communicate on
@@ -129,49 +126,24 @@ class DirectExchange(_Exchange):
     :param dict arguments: Optional key/value arguments
 
     """
-    type = 'direct'
-
-
-class FanoutExchange(_Exchange):
-    """The FanoutExchange class is used for interacting with fanout exchanges
-    only.
-
-    :param channel: The channel object to communicate on
-    :type channel: :py:class:`rabbitpy.channel.Channel`
-    :param str name: The name of the exchange
-    :param bool durable: Request a durable exchange
-    :param bool auto_delete: Automatically delete when not in use
-    :param dict arguments: Optional key/value arguments
-
-    """
-    type = 'fanout'
 
 
-class HeadersExchange(_Exchange):
-    """The HeadersExchange class is used for interacting with direct exchanges
-    only.
+def _typed_exchange(name, exchange_type):
+    """Return a new :py:class:`_Exchange` subclass that is fixed to the
+    specified exchange type.
 
-    :param channel: The channel object to communicate on
-    :type channel: :py:class:`rabbitpy.channel.Channel`
-    :param str name: The name of the exchange
-    :param bool durable: Request a durable exchange
-    :param bool auto_delete: Automatically delete when not in use
-    :param dict arguments: Optional key/value arguments
+    :param str name: The class name
+    :param str exchange_type: The exchange type
+    :rtype: type
 
     """
-    type = 'headers'
-
+    return type(name, (_Exchange,),
+                {'__doc__': _TYPED_DOCSTRING.format(name, exchange_type),
+                 '__module__': __name__,
+                 'type': exchange_type})
 
-class TopicExchange(_Exchange):
-    """The TopicExchange class is used for interacting with topic exchanges
-    only.
 
-    :param channel: The channel object to communicate on
-    :type channel: :py:class:`rabbitpy.channel.Channel`
-    :param str name: The name of the exchange
-    :param bool durable: Request a durable exchange
-    :param bool auto_delete: Automatically delete when not in use
-    :param dict arguments: Optional key/value arguments
-
-    """
-    type = 'topic'
+DirectExchange = _typed_exchange('DirectExchange', 'direct')
+FanoutExchange = _typed_exchange('FanoutExchange', 'fanout')
+HeadersExchange = _typed_exchange('HeadersExchange', 'headers')
+TopicExchange = _typed_exchange('TopicExchange', 'topic')
@@ -19,45 +19,46 @@ class Heartbeat(object):
     """
 
     def __init__(self, io, channel0, interval):
+        # No lock is used: _interval is only set here, _last_written is only
+        # written by the heartbeat thread and io.bytes_written only by the IO
+        # thread. The _stopped event is the only signal between threads.
         self._channel0 = channel0
         self._interval = float(interval) / 2.0
         self._io = io
         self._last_written = self._io.bytes_written
-        self._lock = threading.Lock()
-        self._timer = None
+        self._stopped = threading.Event()
+        self._thread = None
 
     def start(self):
         """Start the heartbeat checker"""
         if not self._interval:
             LOGGER.debug('Heartbeats are disabled, not starting')
             return
-        self._start_timer()
+        self._thread = threading.Thread(target=self._run, name='heartbeat')
+        self._thread.daemon = True
+        self._thread.start()
         LOGGER.debug('Heartbeat started, ensuring data is written at least '
                      'every %.2f seconds', self._interval)
 
     def stop(self):
         """Stop the heartbeat checker"""
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _start_timer(self):
-        """Create a new thread timer, destroying the last if it existed."""
-        if self._timer:
-            del self._timer
-        self._timer = threading.Timer(self._interval, self._maybe_send)
-        self._timer.daemon = True
-        self._timer.start()
+        self._stopped.set()
+        self._thread = None
+
+    def _run(self):
+        """Run in the heartbeat thread, waking every ``self._interval``
+        seconds until stopped to maybe send a heartbeat.
+
+        """
+        while not self._stopped.wait(self._interval):
+            self._maybe_send()
 
     def _maybe_send(self):
-        """Fired by threading.Timer every ``self._interval`` seconds to
-        maybe send a heartbeat to the remote connection, if no other frames
-        have been written.
+        """Invoked every ``self._interval`` seconds to maybe send a heartbeat
+        to the remote connection, if no other frames have been written.
 
         """
-        if not self._io.bytes_written - self._last_written:
+        bytes_written = self._io.bytes_written
+        if bytes_written == self._last_written:
             self._channel0.send_heartbeat()
-        self._lock.acquire(True)
-        self._last_written = self._io.bytes_written
-        self._lock.release()
-        self._start_timer()
+        self._last_written = bytes_written
@@ -6,9 +6,11 @@ level.
 import collections
 import errno
 import logging
-import select
+import os
+import selectors
 import socket
 import ssl
+import struct
 import threading
 
 from pamqp import frame
@@ -21,188 +23,163 @@ from rabbitpy import exceptions
 
 LOGGER = logging.getLogger(__name__)
 
-MAX_READ = specification.FRAME_MAX_SIZE
+# Read up to two max-sized frames per recv so a backlog of small frames
+# buffered by the kernel is picked up with fewer syscalls
+MAX_READ = specification.FRAME_MAX_SIZE * 2
 MAX_WRITE = specification.FRAME_MAX_SIZE
 
 # Timeout in seconds
 POLL_TIMEOUT = 1.0
 
+# AMQP frame header (type, channel, size) and the trailing frame-end octet
+FRAME_HEADER = struct.Struct('>BHI')
+FRAME_OVERHEAD = FRAME_HEADER.size + 1
 
-class _SelectPoller(object):
-    def __init__(self, fd, write_trigger):
-        self.read = [[fd, write_trigger], [], [fd], POLL_TIMEOUT]
-        self.write = [[fd, write_trigger], [fd], [fd], POLL_TIMEOUT]
 
-    def poll(self, write_wanted):
-        """Invoke select.select, waiting for it to return with the per action
-        list of file descriptors that are returned to the IO Loop.
+class _EventTrigger(object):
+    """A socket-like wrapper around a Linux eventfd that is used as both ends
+    of the write trigger, waking the IO loop with a kernel counter instead
+    of sending bytes over a socket pair.
 
-        :param bool write_wanted: Is there data pending to be written
-        :rtype: tuple(list, list, list)
-        :return: (read, write, error)
+    """
+    def __init__(self):
+        self._fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+
+    def close(self):
+        """Close the eventfd, if it is not already closed."""
+        fd, self._fd = self._fd, -1
+        if fd >= 0:
+            os.close(fd)
+
+    def fileno(self):
+        """Return the eventfd file descriptor, or -1 if closed.
+
+        :rtype: int
 
         """
-        try:
-            if write_wanted:
-                rlist, wlist, xlist = select.select(*self.write)
-            else:
-                rlist, wlist, xlist = select.select(*self.read)
-        except select.error:
-            return [], [], []
-        return ([sock.fileno() for sock in rlist],
-                [sock.fileno() for sock in wlist],
-                [sock.fileno() for sock in xlist])
+        return self._fd
 
+    def recv(self, _bufsize):
+        """Read and reset the counter, raising BlockingIOError if it was not
+        incremented since the last read.
 
-class _KQueuePoller(object):
+        :rtype: int
 
-    MAX_EVENTS = 1000
+        """
+        return os.eventfd_read(self._open_fd())
 
-    def __init__(self, fd, write_trigger):
-        self._fd = fd
-        self._write_trigger = write_trigger
-        self._kqueue = select.kqueue()
-        self._kqueue.control([select.kevent(fd, select.KQ_FILTER_READ,
-                                            select.KQ_EV_ADD)], 0)
-        self._kqueue.control([select.kevent(write_trigger,
-                                            select.KQ_FILTER_READ,
-                                            select.KQ_EV_ADD)], 0)
-        self._write_in_last_poll = False
+    def send(self, _data):
+        """Increment the counter, waking the IO loop.
 
-    def poll(self, write_wanted):
-        """Update the KQueue object with the desired actions to block on,
-        waiting until the KQueue.control method returns events and then returns
-        the list of actions containing file descriptors to act on for those
-        actions.
+        :rtype: int
 
-        :param bool write_wanted: Is there data pending to be written
-        :rtype: tuple(list, list, list)
-        :return: (read, write, error)
+        """
+        os.eventfd_write(self._open_fd(), 1)
+        return 1
+
+    def shutdown(self, _how):
+        """Sockets are shutdown before being closed, there is nothing to do
+        for an eventfd.
 
         """
-        rlist, wlist, xlist = [], [], []
-        try:
-            kq_events = self._kqueue.control(self._changelist(write_wanted),
-                                             self.MAX_EVENTS, POLL_TIMEOUT)
-        except select.error as error:
-            LOGGER.debug('kqueue.control error: %s', error)
-            return [], [], []
-        for event in kq_events:
-            if event.filter == select.KQ_FILTER_READ:
-                rlist.append(event.ident)
-            elif event.filter == select.KQ_FILTER_WRITE:
-                wlist.append(event.ident)
-            if event.flags & select.KQ_EV_ERROR:
-                xlist.append(event.ident)
-            if event.flags & select.KQ_EV_EOF == select.KQ_EV_EOF:
-                xlist.append(event.data)
-        if xlist:
-            self._cleanup()
-        return rlist, wlist, xlist
-
-    def _changelist(self, write_wanted):
-        if write_wanted and not self._write_in_last_poll:
-            self._write_in_last_poll = True
-            return [select.kevent(self._fd, select.KQ_FILTER_WRITE,
-                                  select.KQ_EV_ADD)]
-        elif self._write_in_last_poll and not write_wanted:
-            self._write_in_last_poll = False
-            return [select.kevent(self._fd, select.KQ_FILTER_WRITE,
-                                  select.KQ_EV_DELETE)]
-        return None
-
-    def _cleanup(self):
-        self._kqueue.control([select.kevent(self._fd, select.KQ_FILTER_READ,
-                                            select.KQ_EV_DELETE)], 0)
-        self._kqueue.control([select.kevent(self._write_trigger,
-                                            select.KQ_FILTER_READ,
-                                            select.KQ_EV_DELETE)], 0)
-        if self._write_in_last_poll:
-            return [select.kevent(self._fd, select.KQ_FILTER_WRITE,
-                                  select.KQ_EV_DELETE)]
-
-
-class _PollPoller(object):
-
-    # Register constants to prevent platform specific errors
-    POLLIN = 1
-    POLLOUT = 4
-    POLLERR = 8
-
-    READ = POLLIN | POLLERR
-    WRITE = POLLIN | POLLOUT | POLLERR
+
+    def _open_fd(self):
+        """Return the eventfd file descriptor, raising the same error as a
+        closed socket if it has been closed.
+
+        :rtype: int
+        :raises: socket.error
+
+        """
+        if self._fd < 0:
+            raise socket.error(errno.EBADF, os.strerror(errno.EBADF))
+        return self._fd
+
+
+class _SelectorPoller(object):
+    """Poll the RabbitMQ socket and the write trigger socket using the most
+    efficient selector for the platform (epoll, kqueue, poll or select).
+
+    :param socket.socket fd: The RabbitMQ socket
+    :param socket.socket write_trigger: The socket used to interrupt polling
+
+    """
+    READ = selectors.EVENT_READ
+    WRITE = selectors.EVENT_READ | selectors.EVENT_WRITE
 
     def __init__(self, fd, write_trigger):
         self._fd = fd
-        self._poll = select.poll()
-        self._poll.register(fd, self.READ)
-        self._poll.register(write_trigger, self.READ)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, self.READ)
+        self._selector.register(write_trigger, self.READ)
         self._write_in_last_poll = False
+        LOGGER.debug('Polling with %s', self._selector.__class__.__name__)
+
+    def close(self):
+        """Close the selector, releasing any file descriptor it holds."""
+        self._selector.close()
 
     def poll(self, write_wanted):
-        """Update the Poll object with the desired actions to block on, waiting
-        until the poll returns events and then returns the list of actions
+        """Update the selector with the desired actions to block on, waiting
+        until it returns events and then returns the list of actions
         containing file descriptors to act on for those actions.
 
         :param bool write_wanted: Is there data pending to be written
-        :rtype: tuple(list, list, list)
-        :return: (read, write, error)
+        :rtype: tuple(list, list)
+        :return: (read, write)
 
         """
-        self._update_poll(write_wanted)
-        rlist, wlist, xlist = [], [], []
+        rlist, wlist = [], []
         try:
-            poll_events = self._poll.poll(POLL_TIMEOUT * 1000)
-        except select.error:
-            return [], [], []
-        for fileno, event in poll_events:
-            if event & self.POLLIN:
-                rlist.append(fileno)
-            if event & self.POLLOUT:
-                wlist.append(fileno)
-            if event & self.POLLERR:
-                xlist.append(fileno)
-        return rlist, wlist, xlist
-
-    def _update_poll(self, write_wanted):
-        if self._write_in_last_poll:
-            if not write_wanted:
-                self._write_in_last_poll = False
-                self._poll.modify(self._fd, self.READ)
-        else:
-            self._write_in_last_poll = True
-            self._poll.modify(self._fd, self.WRITE)
+            if write_wanted != self._write_in_last_poll:
+                self._selector.modify(
+                    self._fd, self.WRITE if write_wanted else self.READ)
+                self._write_in_last_poll = write_wanted
+            ready = self._selector.select(POLL_TIMEOUT)
+        except (OSError, ValueError) as error:
+            LOGGER.debug('Selector error: %s', error)
+            return [], []
+        for key, mask in ready:
+            if mask & selectors.EVENT_READ:
+                rlist.append(key.fd)
+            if mask & selectors.EVENT_WRITE:
+                wlist.append(key.fd)
+        return rlist, wlist
 
 
 class _IOLoop(object):
-    """Generic base IOLoop implementation that leverages different types of
-    Polling (select, KQueue, poll).
+    """Generic base IOLoop implementation that leverages the platform's
+    preferred selector (epoll, kqueue, poll or select).
 
     """
     def __init__(self, fd, error_callback, read_callback, write_callback,
                  write_queue, event_obj, write_trigger, exception_stack):
-        self._data = threading.local()
-        self._data.fd = fd
-        self._data.error_callback = error_callback
-        self._data.read_callback = read_callback
-        self._data.running = False
-        self._data.ssl = hasattr(fd, 'read')
-        self._data.events = event_obj
-        self._data.write_buffer = collections.deque()
-        self._data.write_callback = write_callback
-        self._data.write_queue = write_queue
-        self._data.write_trigger = write_trigger
+        self._fd = fd
+        self._error_callback = error_callback
+        self._read_callback = read_callback
+        self._running = False
+        self._events = event_obj
+        self._read_buffer = bytearray(MAX_READ)
+        self._read_view = memoryview(self._read_buffer)
+        self._write_buffer = collections.deque()
+        self._write_callback = write_callback
+        self._write_queue = write_queue
+        self._write_trigger = write_trigger
         self._server_sock = None
         self._exceptions = exception_stack
-        self._poller = self._create_poller()
+        self._poller = _SelectorPoller(fd, write_trigger)
+
+        # The descriptors do not change while the loop runs
+        self._fd_fileno = fd.fileno()
+        self._write_trigger_fileno = write_trigger.fileno()
 
     def run(self):
         """Run the IOLoop, blocking until the socket is closed or there is
         another exception.
 
         """
-        self._data.running = True
-        while self._data.running:
+        self._running = True
+        while self._running:
             try:
                 self._poll()
             except EnvironmentError as exception:
@@ -212,105 +189,136 @@ class _IOLoop(object):
                       len(exception.args) == 2 and
                       exception.args[0] == errno.EINTR):
                     continue
-            if self._data.events.is_set(events.SOCKET_CLOSED):
+            if self._events.is_set(events.SOCKET_CLOSED):
                 LOGGER.debug('Exiting due to closed socket')
                 break
-            elif self._data.events.is_set(events.SOCKET_CLOSE):
+            elif self._events.is_set(events.SOCKET_CLOSE):
                 LOGGER.debug('Exiting due to closing socket')
                 self._exceptions.put(exceptions.ConnectionResetException())
                 break
+        self._poller.close()
         LOGGER.debug('Exiting IOLoop.run')
 
     def stop(self):
         """Stop the IOLoop."""
         LOGGER.debug('Stopping IOLoop')
-        self._data.running = False
+        self._running = False
         try:
-            self._data.write_trigger.close()
+            self._write_trigger.close()
         except socket.error:
             pass
 
-    def _create_poller(self):
-        if hasattr(select, 'kqueue'):
-            LOGGER.debug('Returning KQueuePoller')
-            return _KQueuePoller(self._data.fd, self._data.write_trigger)
-        elif hasattr(select, 'poll'):
-            LOGGER.debug('Returning PollPoller')
-            return _PollPoller(self._data.fd, self._data.write_trigger)
-        else:
-            LOGGER.debug('Returning SelectPoller')
-            return _SelectPoller(self._data.fd, self._data.write_trigger)
-
     def _poll(self):
-        # Poll select with the materialized lists
-        if not self._data.running:
+        if not self._running:
             LOGGER.debug('Exiting poll')
+            return
 
-        # Build the outbound write buffer of marshalled frames
-        while not self._data.write_queue.empty():
-            data = self._data.write_queue.get(False)
-            self._data.write_buffer.append(frame.marshal(data[1], data[0]))
+        # Move the marshalled frames to the outbound write buffer
+        self._drain_write_queue()
 
         # Poll the poller, passing in a bool if there is data to write
-        rlist, wlist, xlist = self._poller.poll(bool(self._data.write_buffer))
-
-        if xlist:
-            LOGGER.debug('Poll errors: %r', xlist)
-            self._data.events.set(events.SOCKET_CLOSE)
-            self._data.error_callback('Connection reset')
-            return
+        rlist, wlist = self._poller.poll(bool(self._write_buffer))
 
         # Clear out the trigger socket
-        if self._data.write_trigger.fileno() in rlist:
-            self._data.write_trigger.recv(1024)
+        if self._write_trigger_fileno in rlist:
+            self._drain_write_trigger()
 
         # Read if the data socket is in the read list
-        if self._data.fd.fileno() in rlist:
+        if self._fd_fileno in rlist:
             self._read()
 
         # Write if the data socket is writable
-        if wlist and self._data.write_buffer:
+        if wlist and self._write_buffer:
             self._write()
 
+    def _drain_write_queue(self):
+        """Move all of the pending marshalled frames from the write queue to
+        the write buffer. The IO thread is the only consumer of the queue, so
+        popping from the left of the deque needs no lock.
+
+        """
+        write_queue, write_buffer = self._write_queue, self._write_buffer
+        while write_queue:
+            write_buffer.append(write_queue.popleft())
+
+    def _drain_write_trigger(self):
+        """Read everything written to the non-blocking trigger socket so
+        that bytes left over from a burst of writes do not wake the next
+        poll.
+
+        """
+        try:
+            while self._write_trigger.recv(4096):
+                pass
+        except socket.error:
+            pass
+
     def _read(self):
-        if not self._data.running:
+        if not self._running:
             LOGGER.debug('Skipping read, not running')
             return
         try:
-            if self._data.ssl:
-                self._data.read_callback(self._data.fd.read(MAX_READ))
-            else:
-                self._data.read_callback(self._data.fd.recv(MAX_READ))
+            bytes_read = self._fd.recv_into(self._read_buffer)
         except socket.timeout:
             LOGGER.warning('Timed out reading from socket')
         except socket.error as exception:
-            self._data.running = False
-            self._data.error_callback(exception)
+            self._running = False
+            self._error_callback(exception)
+        else:
+            if not bytes_read:
+                LOGGER.debug('Socket closed by the remote server')
+                self._events.set(events.SOCKET_CLOSE)
+                self._error_callback('Connection reset')
+                return
+            self._read_callback(self._read_view[:bytes_read])
 
     def _write(self):
-        if not self._data.running:
+        if not self._running:
             LOGGER.debug('Skipping write frame, not running')
             return
 
-        frame_data = self._data.write_buffer.popleft()
+        frame_data = self._next_write()
         try:
-            bytes_sent = self._data.fd.send(frame_data)
+            bytes_sent = self._fd.send(frame_data)
         except socket.timeout:
             LOGGER.warning('Timed out writing %i bytes to socket',
                            len(frame_data))
-            self._data.write_buffer.appendleft(frame_data)
+            self._write_buffer.appendleft(frame_data)
         except socket.error as error:
             if error.errno == 35:
                 LOGGER.debug('socket resource temp unavailable')
-                self._data.write_buffer.appendleft(frame_data)
+                self._write_buffer.appendleft(frame_data)
             else:
-                self._data.running = False
-                self._data.error_callback(error)
+                self._running = False
+                self._error_callback(error)
         else:
-            self._data.write_callback(bytes_sent)
-            # If the entire frame could not be send, send the rest next time
+            self._write_callback(bytes_sent)
+            # If the entire frame could not be send, send the rest next time,
+            # referencing the unsent bytes instead of copying them
             if bytes_sent < len(frame_data):
-                self._data.write_buffer.appendleft(frame_data[bytes_sent:])
+                self._write_buffer.appendleft(
+                    memoryview(frame_data)[bytes_sent:])
+
+    def _next_write(self):
+        """Return the data to send in the next write, joining as many of
+        the buffered frames as fit in ``MAX_WRITE`` bytes so that a burst of
+        small frames is sent with a single call to the socket. A frame that
+        is larger than ``MAX_WRITE`` on its own is returned as-is.
+
+        :rtype: bytes or memoryview
+
+        """
+        write_buffer = self._write_buffer
+        frame_data = write_buffer.popleft()
+        if not write_buffer or len(frame_data) >= MAX_WRITE:
+            return frame_data
+        chunks, size = [frame_data], len(frame_data)
+        while write_buffer and size + len(write_buffer[0]) <= MAX_WRITE:
+            chunks.append(write_buffer.popleft())
+            size += len(chunks[-1])
+        if len(chunks) == 1:
+            return frame_data
+        return b''.join(chunks)
 
 
 class IO(threading.Thread, base.StatefulObject):
@@ -319,15 +327,7 @@ class IO(threading.Thread, base.StatefulObject):
     thread-safe data structures.
 
     """
-    CONTENT_METHODS = ['Basic.Deliver', 'Basic.GetOk']
     READ_BUFFER_SIZE = specification.FRAME_MAX_SIZE
-    SSL_KWARGS = {
-        'keyfile': 'keyfile',
-        'certfile': 'certfile',
-        'cert_reqs': 'verify',
-        'ssl_version': 'ssl_version',
-        'ca_certs': 'cacertfile'
-    }
 
     def __init__(self,
                  group=None,
@@ -344,14 +344,18 @@ class IO(threading.Thread, base.StatefulObject):
         self._exceptions = kwargs['exceptions']
         self._write_queue = kwargs['write_queue']
 
+        # Loaded once per connection, so certificates rotated on disk are
+        # picked up by the next connection
+        self._ssl_ctx = (self._create_ssl_context()
+                         if self._args.get('ssl') else None)
+
         # A socket to trigger write interrupts with
         self._write_listener, self._write_trigger = self._socketpair()
 
         self._bytes_read = 0
         self._bytes_written = 0
 
-        self._buffer = bytes()
-        self._lock = threading.RLock()
+        self._buffer = bytearray()
         self._channels = dict()
         self._remote_name = None
         self._socket = None
@@ -433,34 +437,65 @@ class IO(threading.Thread, base.StatefulObject):
 
     def on_read(self, data):
         """Append the data that is read to the buffer and try and parse
-        frames out of it.
+        frames out of it. The data is copied into the buffer, so a view
+        of the IO loop's read buffer may be passed in.
 
-        :param bytes data: The data that has been read in
+        :param data: The data that has been read in
+        :type data: bytes or memoryview
 
         """
-        self._buffer += data
-
-        while self._buffer:
+        buffer = self._buffer
+        buffer.extend(data)
 
-            # Read and process data
-            value = self._read_frame()
+        # Increment the byte counter used by the heartbeat timer
+        self._bytes_read += len(data)
 
-            # Increment the byte counter used by the heartbeat timer
-            self._bytes_read += len(value)
+        # Look up the per-frame callables once rather than for every frame
+        channels, get_frame = self._channels, self._get_frame_from_str
+        frame_header_size = FRAME_HEADER.size
+        unpack_header = FRAME_HEADER.unpack_from
 
-            # Break out if a frame could not be decoded
-            if self._buffer and value[0] is None:
-                break
-
-            # LOGGER.debug('Received (%i) %r', value[0], value[1])
-
-            # If it's channel 0, call the Channel0 directly
-            if value[0] == 0:
-                with self._lock:
-                    self._channels[0][0].on_frame(value[1])
-                continue
+        offset = 0
+        try:
+            while True:
+
+                # Break out if the buffer does not hold a complete frame
+                available = len(buffer) - offset
+                if buffer.startswith(b'AMQP', offset):
+                    byte_count = 8
+                elif available < frame_header_size:
+                    break
+                else:
+                    byte_count = unpack_header(
+                        buffer, offset)[2] + FRAME_OVERHEAD
+                if available < byte_count:
+                    break
+
+                # Copy the frame out once, releasing the view so the buffer
+                # can be resized when the consumed frames are removed from it
+                with memoryview(buffer) as view:
+                    value = bytes(view[offset:offset + byte_count])
+
+                # Break out if a frame could not be decoded
+                channel_id, value = get_frame(value)
+                if value is None:
+                    break
+                offset += byte_count
+
+                # LOGGER.debug('Received (%i) %r', channel_id, value)
+
+                channel, read_queue = channels[channel_id]
+
+                # If it's channel 0, call the Channel0 directly
+                if channel_id == 0:
+                    channel.on_frame(value)
+                    continue
 
-            self._add_frame_to_read_queue(value[0], value[1])
+                read_queue.put(value)
+        finally:
+            # Drop the frames that were read with a single in-place shift
+            if offset:
+                del buffer[:offset]
 
     def on_write(self, bytes_written):
         """Keep track of how many bytes have been written.
@@ -483,18 +518,6 @@ class IO(threading.Thread, base.StatefulObject):
         """
         return self._write_trigger
 
-    def _add_frame_to_read_queue(self, channel_id, frame_value):
-        """Add the frame to the stack by creating the key value used in
-        expectations and then add it to the list.
-
-        :param int channel_id: The channel id the frame was received on
-        :param frame_value: The frame to add
-        :type frame_value: :class:`~pamqp.specification.Frame`
-
-        """
-        # LOGGER.debug('Adding %s to channel %s', frame_value.name, channel_id)
-        self._channels[channel_id][1].put(frame_value)
-
     def _close(self):
         """Close the socket and set the proper event states"""
         self._events.clear(events.SOCKET_OPENED)
@@ -563,6 +586,24 @@ class IO(threading.Thread, base.StatefulObject):
         self._events.set(events.SOCKET_OPENED)
         self._set_state(self.OPEN)
 
+    def _create_ssl_context(self):
+        """Create the SSL context for the connection from the SSL connection
+        arguments, loading the certificate chain and CA file if specified.
+
+        :rtype: ssl.SSLContext
+
+        """
+        context = ssl.SSLContext(self._args['ssl_version'] or
+                                 ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = self._args['verify'] or ssl.CERT_NONE
+        if self._args['certfile']:
+            context.load_cert_chain(self._args['certfile'],
+                                    self._args['keyfile'])
+        if self._args['cacertfile']:
+            context.load_verify_locations(self._args['cacertfile'])
+        return context
+
     def _create_socket(self, address_family, socktype, protocol):
         """Create the new socket, optionally with SSL support.
 
@@ -573,14 +614,12 @@ class IO(threading.Thread, base.StatefulObject):
 
         """
         sock = socket.socket(address_family, socktype, protocol)
+        # Send small frames such as acks and heartbeats immediately
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         if self._args['ssl']:
-            kwargs = {'sock': sock, 'server_side': False}
-            for argv, key in self.SSL_KWARGS.items():
-                if self._args[key]:
-                    kwargs[argv] = self._args[key]
-            LOGGER.debug('Wrapping socket for SSL: %r', kwargs)
-            context = ssl.SSLContext()
-            return context.wrap_socket(**kwargs)
+            LOGGER.debug('Wrapping socket for SSL')
+            return self._ssl_ctx.wrap_socket(
+                sock, server_side=False, server_hostname=self._args['host'])
         return sock
 
     def _disconnect_socket(self):
@@ -602,33 +641,22 @@ class IO(threading.Thread, base.StatefulObject):
 
     @staticmethod
     def _get_frame_from_str(value):
-        """Get the pamqp frame from the string value.
+        """Get the pamqp frame from the string value, which holds exactly
+        one frame.
 
-        :param str value: The value to parse for an pamqp frame
-        :return (str, int, pamqp.specification.Frame): Remainder of value,
-                                                       channel id and
-                                                       frame value
+        :param bytes value: The value to parse for an pamqp frame
+        :return (int, pamqp.specification.Frame): The channel id and
+                                                  frame value
         """
-        if not value:
-            return value, None, None
         try:
-            byte_count, channel_id, frame_in = frame.unmarshal(value)
+            _byte_count, channel_id, frame_in = frame.unmarshal(value)
         except pamqp_exceptions.UnmarshalingException:
-            return value, None, None
+            return None, None
         except specification.AMQPFrameError as error:
             LOGGER.error('Failed to demarshal: %r', error, exc_info=True)
             LOGGER.debug(value)
-            return value, None, None
-        return value[byte_count:], channel_id, frame_in
-
-    def _read_frame(self):
-        """Read from the buffer and try and get the demarshaled frame.
-
-        :rtype (int, pamqp.specification.Frame): The channel and frame
-
-        """
-        self._buffer, chan_id, value = self._get_frame_from_str(self._buffer)
-        return chan_id, value
+            return None, None
+        return channel_id, frame_in
 
     def _remote_close_channel(self, channel_id, frame_value):
         """Invoke the on_channel_close code in the specified channel. This will
@@ -642,11 +670,15 @@ class IO(threading.Thread, base.StatefulObject):
         self._channels[channel_id][0].on_remote_close(frame_value)
 
     def _socketpair(self):
-        """Return a socket pair regardless of platform.
+        """Return a socket pair regardless of platform. Where eventfd is
+        available, the same eventfd backed trigger is returned as both ends.
 
         :rtype: (socket.socket, socket.socket)
 
         """
+        if hasattr(os, 'eventfd'):
+            trigger = _EventTrigger()
+            return trigger, trigger
         try:
             server, client = socket.socketpair()
         except AttributeError:
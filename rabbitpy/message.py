@@ -255,33 +255,9 @@ class Message(base.AMQPClass):
         :raises: rabbitpy.exceptions.MessageReturnedException
 
         """
-        if isinstance(exchange, base.AMQPClass):
-            exchange = exchange.name
-
-        # Coerce the body to the proper type
-        payload = utils.maybe_utf8_encode(self.body)
-
-        frames = [specification.Basic.Publish(exchange=exchange,
-                                              routing_key=routing_key or '',
-                                              mandatory=mandatory,
-                                              immediate=immediate),
-                  header.ContentHeader(body_size=len(payload),
-                                       properties=self._properties)]
-
-        # Calculate how many body frames are needed
-        pieces = int(math.ceil(len(payload) /
-                               float(self.channel.maximum_frame_size)))
-
-        # Send the message
-        for offset in range(0, pieces):
-            start = self.channel.maximum_frame_size * offset
-            end = start + self.channel.maximum_frame_size
-            if end > len(payload):
-                end = len(payload)
-            frames.append(body.ContentBody(payload[start:end]))
-
         # Write the frames out
-        self.channel.write_frames(frames)
+        self.channel.write_frames(
+            self._publish_frames(exchange, routing_key, mandatory, immediate))
 
         # If publisher confirmations are enabled, wait for the response
         if self.channel.publisher_confirms:
@@ -413,3 +389,40 @@ class Message(base.AMQPClass):
         for key in self._invalid_properties:
             LOGGER.warning('Removing invalid property "%s"', key)
             del self.properties[key]
+
+    def _publish_frames(self, exchange, routing_key, mandatory, immediate):
+        """Return the list of frames used to publish the message, breaking the
+        body up into multiple body frames if needed.
+
+        :param exchange: The exchange to publish the message to
+        :type exchange: str or :class:`rabbitpy.Exchange`
+        :param str routing_key: The routing key to use
+        :param bool mandatory: Requires the message is published
+        :param bool immediate: Request immediate delivery
+        :rtype: list
+
+        """
+        if isinstance(exchange, base.AMQPClass):
+            exchange = exchange.name
+
+        # Coerce the body to the proper type
+        payload = utils.maybe_utf8_encode(self.body)
+
+        frames = [specification.Basic.Publish(exchange=exchange,
+                                              routing_key=routing_key or '',
+                                              mandatory=mandatory,
+                                              immediate=immediate),
+                  header.ContentHeader(body_size=len(payload),
+                                       properties=self._properties)]
+
+        # Calculate how many body frames are needed
+        pieces = int(math.ceil(len(payload) /
+                               float(self.channel.maximum_frame_size)))
+
+        for offset in range(0, pieces):
+            start = self.channel.maximum_frame_size * offset
+            end = start + self.channel.maximum_frame_size
+            if end > len(payload):
+                end = len(payload)
+            frames.append(body.ContentBody(payload[start:end]))
+        return frames
@@ -1,3 +1,4 @@
+import collections
 try:
     import unittest2 as unittest
 except ImportError:
@@ -25,7 +26,7 @@ class TestCase(unittest.TestCase):
                                        self.connection._events,
                                        self.connection._exceptions,
                                        connection.queue.Queue(),
-                                       connection.queue.Queue(), 32768,
+                                       collections.deque(), 32768,
                                        self.connection._io.write_trigger,
                                        connection=self.connection)
         self.channel._set_state(self.channel.OPEN)
\ No newline at end of file
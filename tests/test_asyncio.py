@@ -0,0 +1,85 @@
+"""
+Test the rabbitpy.asyncio.AsyncConnection class
+
+"""
+import asyncio
+import mock
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from rabbitpy import asyncio as rabbitpy_asyncio
+
+
+class AsyncConnectionTests(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(rabbitpy_asyncio, 'Connection')
+        self.connection_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connection = rabbitpy_asyncio.AsyncConnection('amqp://foo')
+
+    def test_open_creates_connection(self):
+        asyncio.run(self.connection.open())
+        self.connection_cls.assert_called_once_with('amqp://foo')
+        self.assertEqual(self.connection.connection,
+                         self.connection_cls.return_value)
+
+    def test_channel_invokes_connection_channel(self):
+        async def run():
+            await self.connection.open()
+            return await self.connection.channel(True)
+        result = asyncio.run(run())
+        self.connection_cls.return_value.channel.assert_called_once_with(True)
+        self.assertEqual(result,
+                         self.connection_cls.return_value.channel.return_value)
+
+    def test_publish_invokes_message_publish(self):
+        message = mock.Mock()
+        message.publish.return_value = True
+        self.assertTrue(asyncio.run(
+            self.connection.publish(message, 'foo', 'bar')))
+        message.publish.assert_called_once_with('foo', 'bar', False)
+
+    def test_context_manager_closes(self):
+        async def run():
+            async with self.connection:
+                pass
+        asyncio.run(run())
+        self.connection_cls.return_value.close.assert_called_once_with()
+
+    def test_context_manager_propagates_exception(self):
+        async def run():
+            async with self.connection:
+                raise ValueError('foo')
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+        self.connection_cls.return_value.close.assert_not_called()
+
+    def test_close_before_open_shuts_down_executor(self):
+        asyncio.run(self.connection.close())
+        self.assertTrue(self.connection._executor._shutdown)
+
+    def test_close_after_failed_open_shuts_down_executor(self):
+        self.connection_cls.side_effect = ValueError('foo')
+
+        async def run():
+            try:
+                await self.connection.open()
+            except ValueError:
+                pass
+            await self.connection.close()
+        asyncio.run(run())
+        self.assertIsNone(self.connection.connection)
+        self.assertTrue(self.connection._executor._shutdown)
+
+    def test_context_manager_failed_open_shuts_down_executor(self):
+        self.connection_cls.side_effect = ValueError('foo')
+
+        async def run():
+            async with self.connection:
+                pass
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+        self.assertTrue(self.connection._executor._shutdown)
@@ -0,0 +1,46 @@
+"""
+Test the rabbitpy.channel.Channel write path
+
+"""
+from pamqp import frame
+from pamqp import specification
+
+from rabbitpy import exceptions
+
+from tests import helpers
+
+
+class WriteFrameTests(helpers.TestCase):
+
+    def test_write_frame_adds_to_write_queue(self):
+        frame_value = specification.Basic.Ack(1)
+        self.channel.write_frame(frame_value)
+        self.assertEqual(self.channel._write_queue.popleft(),
+                         frame.marshal(frame_value, 1))
+
+    def test_write_frame_on_closed_channel_raises(self):
+        self.channel._set_state(self.channel.CLOSED)
+        self.assertRaises(exceptions.ChannelClosedException,
+                          self.channel.write_frame,
+                          specification.Basic.Ack(1))
+
+    def test_write_frame_on_closed_connection_raises(self):
+        self.connection.closed = True
+        self.assertRaises(exceptions.ConnectionClosed,
+                          self.channel.write_frame,
+                          specification.Basic.Ack(1))
+
+
+class RemoteCloseTests(helpers.TestCase):
+
+    def test_mapped_reply_code_raises_mapped_exception(self):
+        frame_value = specification.Channel.Close(404, 'NOT_FOUND')
+        self.assertRaises(exceptions.AMQPNotFound,
+                          self.channel._on_remote_close, frame_value)
+
+    def test_unmapped_reply_code_raises_remote_closed(self):
+        frame_value = specification.Channel.Close(599, 'UNKNOWN')
+        with self.assertRaises(
+                exceptions.RemoteClosedChannelException) as context:
+            self.channel._on_remote_close(frame_value)
+        self.assertEqual(context.exception.reply_code, 599)
@@ -0,0 +1,55 @@
+"""
+Test the rabbitpy.connection.Connection class
+
+"""
+import mock
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from rabbitpy import connection
+
+
+class ConnectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.object(connection.Connection, '_connect'):
+            self.connection = connection.Connection()
+        self.connection._io = mock.Mock()
+        self.connection._set_state(self.connection.OPEN)
+
+
+class ContextManagerTests(ConnectionTestCase):
+
+    def test_exit_without_exception_closes(self):
+        with mock.patch.object(self.connection, 'close') as close:
+            with self.connection:
+                pass
+            close.assert_called_once_with()
+
+    def test_exit_with_exception_propagates(self):
+        with mock.patch.object(self.connection, '_shutdown_connection'):
+            with self.assertRaises(ValueError):
+                with self.connection:
+                    raise ValueError('foo')
+
+    def test_exit_with_exception_forces_shutdown(self):
+        with mock.patch.object(self.connection,
+                               '_shutdown_connection') as shutdown:
+            try:
+                with self.connection:
+                    raise ValueError('foo')
+            except ValueError:
+                pass
+            shutdown.assert_called_once_with(True)
+        self.assertTrue(self.connection.closed)
+
+
+class ShutdownConnectionTests(ConnectionTestCase):
+
+    def test_shutdown_joins_io_thread(self):
+        self.connection._io.is_alive.return_value = False
+        self.connection._shutdown_connection(True)
+        self.connection._io.join.assert_called_once_with(
+            self.connection.args['timeout'])
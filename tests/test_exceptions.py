@@ -0,0 +1,167 @@
+"""
+Test the rabbitpy.exceptions module
+
+"""
+import pickle
+import traceback
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from rabbitpy import exceptions
+
+
+class LookupTests(unittest.TestCase):
+
+    def test_mapped_codes_return_class(self):
+        for code, cls in exceptions.AMQP.items():
+            self.assertIs(exceptions.lookup(code), cls)
+
+    def test_unmapped_code_in_range_returns_none(self):
+        self.assertIsNone(exceptions.lookup(400))
+
+    def test_code_below_range_returns_none(self):
+        self.assertIsNone(exceptions.lookup(200))
+
+    def test_code_above_range_returns_none(self):
+        self.assertIsNone(exceptions.lookup(999))
+
+    def test_amqp_mapping_is_read_only(self):
+        with self.assertRaises(TypeError):
+            exceptions.AMQP[999] = exceptions.AMQPException
+
+
+class FormattingTests(unittest.TestCase):
+
+    def test_str_formats_args(self):
+        error = exceptions.RemoteClosedChannelException(1, 404, 'Not Found')
+        self.assertEqual(str(error),
+                         'Channel 1 was closed by the remote server '
+                         '(404): Not Found')
+
+    def test_str_is_cached(self):
+        error = exceptions.RemoteClosedException(320, 'Forced')
+        self.assertIs(str(error), str(error))
+
+    def test_str_without_format_uses_args(self):
+        self.assertEqual(str(exceptions.AMQPNotFound('foo')), 'foo')
+
+    def test_constant_message(self):
+        self.assertEqual(str(exceptions.NotConsumingError()),
+                         'No active consumer to cancel')
+
+    def test_constant_message_is_shared(self):
+        self.assertIs(str(exceptions.ChannelClosedException()),
+                      str(exceptions.ChannelClosedException()))
+
+    def test_not_supported_formats_feature(self):
+        self.assertEqual(str(exceptions.NotSupportedError('Basic.Nack')),
+                         'The selected feature "Basic.Nack" is not supported')
+
+    def test_connection_exception_formats_address(self):
+        error = exceptions.ConnectionException('localhost', 5672, 'Refused')
+        self.assertEqual(str(error), 'Unable to connect to the remote server '
+                                     'localhost:5672 (Refused)')
+
+    def test_connection_exception_without_args(self):
+        self.assertEqual(str(exceptions.ConnectionException()),
+                         'Unable to connect to the remote server')
+
+    def test_unexpected_response_with_response_only(self):
+        self.assertEqual(str(exceptions.UnexpectedResponseError('foo')),
+                         'Received an unexpected response: foo')
+
+    def test_message_returned_formats_exchange(self):
+        error = exceptions.MessageReturnedException(312, 'NO_ROUTE', 'foo',
+                                                    'bar')
+        self.assertEqual(str(error), 'Message was returned by RabbitMQ: '
+                                     '(312) NO_ROUTE for exchange foo')
+
+    def test_repr_is_not_the_message(self):
+        error = exceptions.RemoteClosedException(320, 'Forced')
+        self.assertEqual(repr(error),
+                         "RemoteClosedException(320, 'Forced')")
+
+    def test_traceback_uses_formatted_message(self):
+        error = exceptions.RemoteClosedException(320, 'Forced')
+        self.assertEqual(
+            traceback.format_exception_only(type(error), error)[-1],
+            'rabbitpy.exceptions.RemoteClosedException: Connection was '
+            'closed by the remote server (320): Forced\n')
+
+
+class LookupDefaultTests(unittest.TestCase):
+
+    def test_unmapped_code_in_range_returns_default(self):
+        self.assertIs(exceptions.lookup(400, exceptions.RemoteClosedException),
+                      exceptions.RemoteClosedException)
+
+    def test_code_out_of_range_returns_default(self):
+        self.assertIs(exceptions.lookup(999, exceptions.RemoteClosedException),
+                      exceptions.RemoteClosedException)
+
+    def test_mapped_code_ignores_default(self):
+        self.assertIs(exceptions.lookup(404, exceptions.RemoteClosedException),
+                      exceptions.AMQPNotFound)
+
+
+class HierarchyTests(unittest.TestCase):
+
+    def test_mapped_exceptions_extend_amqp_exception(self):
+        for cls in exceptions.AMQP.values():
+            self.assertTrue(issubclass(cls, exceptions.AMQPException), cls)
+
+    def test_mapped_exceptions_are_module_attributes(self):
+        for cls in exceptions.AMQP.values():
+            self.assertIs(getattr(exceptions, cls.__name__), cls)
+            self.assertEqual(cls.__module__, 'rabbitpy.exceptions')
+            self.assertTrue(cls.__doc__)
+
+    def test_mapped_exception_pickle_round_trip(self):
+        value = pickle.loads(pickle.dumps(exceptions.AMQPNotFound('foo')))
+        self.assertIsInstance(value, exceptions.AMQPNotFound)
+
+
+class AttributeTests(unittest.TestCase):
+
+    def test_remote_closed_channel_attributes(self):
+        error = exceptions.RemoteClosedChannelException(1, 404, 'Not Found')
+        self.assertEqual((error.channel_id, error.reply_code,
+                          error.reply_text), (1, 404, 'Not Found'))
+        self.assertEqual(error.args, (1, 404, 'Not Found'))
+
+    def test_message_returned_attributes(self):
+        error = exceptions.MessageReturnedException(312, 'NO_ROUTE', 'foo',
+                                                    'bar')
+        self.assertEqual(error.exchange, 'foo')
+        self.assertEqual(error.routing_key, 'bar')
+
+    def test_pickle_round_trip(self):
+        error = exceptions.RemoteClosedException(320, 'Forced')
+        value = pickle.loads(pickle.dumps(error))
+        self.assertEqual((value.reply_code, value.reply_text),
+                         (320, 'Forced'))
+
+
+class ModuleTests(unittest.TestCase):
+
+    def test_all_names_are_defined(self):
+        for name in exceptions.__all__:
+            self.assertTrue(hasattr(exceptions, name), name)
+
+
+class DetachTests(unittest.TestCase):
+
+    def test_detach_removes_references(self):
+        try:
+            try:
+                raise ValueError('foo')
+            except ValueError as error:
+                raise exceptions.ActionException('bar') from error
+        except exceptions.ActionException as error:
+            value = exceptions.detach(error)
+        self.assertIsNone(value.__traceback__)
+        self.assertIsNone(value.__cause__)
+        self.assertIsNone(value.__context__)
+        self.assertEqual(str(value), 'bar')
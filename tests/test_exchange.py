@@ -65,6 +65,22 @@ class TxTests(helpers.TestCase):
                               specification.Exchange.Unbind)
 
 
+class ExchangeArgumentsTests(helpers.TestCase):
+
+    def test_default_arguments_is_empty_dict(self):
+        obj = exchange.Exchange(self.channel, 'foo')
+        self.assertDictEqual(obj.arguments, {})
+
+    def test_default_arguments_are_not_shared(self):
+        obj1 = exchange.Exchange(self.channel, 'foo')
+        obj2 = exchange.Exchange(self.channel, 'bar')
+        obj1.arguments['alternate-exchange'] = 'baz'
+        self.assertDictEqual(obj2.arguments, {})
+
+    def test_class_default_is_not_mutable(self):
+        self.assertIsNone(exchange.Exchange.arguments)
+
+
 class DirectExchangeCreationTests(helpers.TestCase):
 
     def test_init_creates_direct_exchange(self):
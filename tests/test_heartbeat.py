@@ -0,0 +1,66 @@
+"""
+Test the rabbitpy.heartbeat.Heartbeat class
+
+"""
+import mock
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from rabbitpy import heartbeat
+
+
+class HeartbeatTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.io = mock.Mock(bytes_written=0)
+        self.channel0 = mock.Mock()
+        self.heartbeat = heartbeat.Heartbeat(self.io, self.channel0, 10)
+
+
+class MaybeSendTests(HeartbeatTestCase):
+
+    def test_sends_heartbeat_when_nothing_written(self):
+        self.heartbeat._maybe_send()
+        self.channel0.send_heartbeat.assert_called_once_with()
+
+    def test_does_not_send_heartbeat_when_data_written(self):
+        self.io.bytes_written = 100
+        self.heartbeat._maybe_send()
+        self.channel0.send_heartbeat.assert_not_called()
+
+    def test_last_written_is_updated(self):
+        self.io.bytes_written = 100
+        self.heartbeat._maybe_send()
+        self.assertEqual(self.heartbeat._last_written, 100)
+
+
+class ThreadTests(HeartbeatTestCase):
+
+    def test_disabled_does_not_start_thread(self):
+        value = heartbeat.Heartbeat(self.io, self.channel0, 0)
+        value.start()
+        self.assertIsNone(value._thread)
+
+    def test_start_creates_daemon_thread(self):
+        with mock.patch.object(self.heartbeat, '_run'):
+            self.heartbeat.start()
+            self.assertTrue(self.heartbeat._thread.daemon)
+            self.heartbeat.stop()
+
+    def test_run_sends_until_stopped(self):
+        self.heartbeat._interval = 0.01
+
+        def stop_after_second():
+            if self.channel0.send_heartbeat.call_count == 2:
+                self.heartbeat.stop()
+
+        self.channel0.send_heartbeat.side_effect = stop_after_second
+        self.heartbeat._run()
+        self.assertEqual(self.channel0.send_heartbeat.call_count, 2)
+
+    def test_run_exits_immediately_when_stopped(self):
+        self.heartbeat.stop()
+        self.heartbeat._run()
+        self.channel0.send_heartbeat.assert_not_called()
@@ -0,0 +1,373 @@
+"""
+Test the rabbitpy.io.IO class
+
+"""
+import collections
+import os
+import queue
+import socket
+import ssl
+
+import mock
+from pamqp import body
+from pamqp import frame
+from pamqp import header
+from pamqp import heartbeat
+from pamqp import specification
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from rabbitpy import events
+from rabbitpy import io
+
+
+class IOTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.io = io.IO(kwargs={'connection_args': {},
+                                'events': events.Events(),
+                                'exceptions': queue.Queue(),
+                                'write_queue': collections.deque()})
+        self.addCleanup(self.io._close)
+        self.channel0 = mock.Mock()
+        self.read_queue = queue.Queue()
+        self.io._channels[0] = self.channel0, None
+        self.io._channels[1] = mock.Mock(), self.read_queue
+
+    def read_frames(self):
+        values = []
+        while not self.read_queue.empty():
+            values.append(self.read_queue.get())
+        return values
+
+
+class OnReadTests(IOTestCase):
+
+    def test_single_frame_is_dispatched(self):
+        self.io.on_read(frame.marshal(specification.Basic.Ack(1), 1))
+        values = self.read_frames()
+        self.assertEqual(len(values), 1)
+        self.assertIsInstance(values[0], specification.Basic.Ack)
+
+    def test_many_frames_in_one_read(self):
+        data = b''.join(frame.marshal(specification.Basic.Ack(tag), 1)
+                        for tag in range(1, 101))
+        self.io.on_read(data)
+        values = self.read_frames()
+        self.assertEqual([v.delivery_tag for v in values],
+                         list(range(1, 101)))
+        self.assertEqual(len(self.io._buffer), 0)
+
+    def test_partial_frame_is_buffered(self):
+        data = frame.marshal(specification.Basic.Ack(1), 1)
+        self.io.on_read(data[:5])
+        self.assertEqual(self.read_frames(), [])
+        self.io.on_read(data[5:-1])
+        self.assertEqual(self.read_frames(), [])
+        self.io.on_read(data[-1:])
+        self.assertEqual(len(self.read_frames()), 1)
+
+    def test_trailing_partial_frame_is_kept(self):
+        data = frame.marshal(specification.Basic.Ack(1), 1)
+        self.io.on_read(data + data[:3])
+        self.assertEqual(len(self.read_frames()), 1)
+        self.assertEqual(bytes(self.io._buffer), data[:3])
+
+    def test_frame_is_consumed_when_channel0_raises(self):
+        data = heartbeat.Heartbeat().marshal()
+        self.channel0.on_frame.side_effect = ValueError('foo')
+        with self.assertRaises(ValueError):
+            self.io.on_read(data + data[:3])
+        self.assertEqual(bytes(self.io._buffer), data[:3])
+
+    def test_body_frame_value_is_bytes(self):
+        self.io.on_read(frame.marshal(body.ContentBody(b'foo'), 1))
+        value = self.read_frames()[0]
+        self.assertIsInstance(value.value, bytes)
+        self.assertEqual(value.value, b'foo')
+
+    def test_channel0_frames_are_passed_to_channel0(self):
+        self.io.on_read(heartbeat.Heartbeat().marshal())
+        self.assertIsInstance(self.channel0.on_frame.call_args[0][0],
+                              heartbeat.Heartbeat)
+
+    def test_protocol_header_is_read(self):
+        self.io.on_read(header.ProtocolHeader().marshal())
+        self.assertIsInstance(self.channel0.on_frame.call_args[0][0],
+                              header.ProtocolHeader)
+
+    def test_bytes_received_counts_bytes_read(self):
+        data = frame.marshal(specification.Basic.Ack(1), 1)
+        self.io.on_read(data)
+        self.assertEqual(self.io.bytes_received, len(data))
+
+
+class CreateSocketTests(IOTestCase):
+
+    def test_tcp_nodelay_is_set(self):
+        self.io._args['ssl'] = False
+        with mock.patch('socket.socket') as sock:
+            value = self.io._create_socket(socket.AF_INET,
+                                           socket.SOCK_STREAM, 0)
+        value.setsockopt.assert_called_once_with(socket.IPPROTO_TCP,
+                                                 socket.TCP_NODELAY, 1)
+        self.assertIs(value, sock.return_value)
+
+
+class SSLContextTests(unittest.TestCase):
+
+    ARGS = {'host': 'localhost', 'ssl': True, 'keyfile': None,
+            'certfile': None, 'verify': None, 'ssl_version': None,
+            'cacertfile': None}
+
+    def create_io(self, **kwargs):
+        args = dict(self.ARGS)
+        args.update(kwargs)
+        value = io.IO(kwargs={'connection_args': args,
+                              'events': events.Events(),
+                              'exceptions': queue.Queue(),
+                              'write_queue': collections.deque()})
+        self.addCleanup(value._close)
+        return value
+
+    def test_context_is_not_created_without_ssl(self):
+        self.assertIsNone(self.create_io(ssl=False)._ssl_ctx)
+
+    def test_context_defaults_to_no_verification(self):
+        context = self.create_io()._ssl_ctx
+        self.assertEqual(context.verify_mode, ssl.CERT_NONE)
+        self.assertFalse(context.check_hostname)
+
+    def test_context_uses_verify_argument(self):
+        context = self.create_io(verify=ssl.CERT_OPTIONAL)._ssl_ctx
+        self.assertEqual(context.verify_mode, ssl.CERT_OPTIONAL)
+
+    def test_context_is_created_per_connection(self):
+        self.assertIsNot(self.create_io()._ssl_ctx,
+                         self.create_io()._ssl_ctx)
+
+    def test_create_socket_wraps_with_context(self):
+        value = self.create_io()
+        value._ssl_ctx = context = mock.Mock()
+        with mock.patch('socket.socket') as sock:
+            result = value._create_socket(socket.AF_INET,
+                                          socket.SOCK_STREAM, 0)
+        context.wrap_socket.assert_called_once_with(
+            sock.return_value, server_side=False, server_hostname='localhost')
+        self.assertIs(result, context.wrap_socket.return_value)
+
+
+class IOLoopTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.local, self.remote = socket.socketpair()
+        self.trigger, self.listener = socket.socketpair()
+        for sock in (self.local, self.remote, self.trigger, self.listener):
+            self.addCleanup(sock.close)
+        self.error_callback = mock.Mock()
+        self.read_callback = mock.Mock()
+        self.write_callback = mock.Mock()
+        self.loop = io._IOLoop(self.local, self.error_callback,
+                               self.read_callback, self.write_callback,
+                               collections.deque(), events.Events(),
+                               self.listener, queue.Queue())
+        self.loop._running = True
+        self.addCleanup(self.loop._poller.close)
+
+
+class IOLoopReadTests(IOLoopTestCase):
+
+    def test_read_passes_view_of_data_read(self):
+        self.remote.sendall(b'foo')
+        self.loop._read()
+        value = self.read_callback.call_args[0][0]
+        self.assertIsInstance(value, memoryview)
+        self.assertEqual(value.tobytes(), b'foo')
+
+    def test_read_reuses_buffer(self):
+        self.remote.sendall(b'foo')
+        self.loop._read()
+        first = self.read_callback.call_args[0][0]
+        self.remote.sendall(b'bar')
+        self.loop._read()
+        second = self.read_callback.call_args[0][0]
+        self.assertIs(first.obj, second.obj)
+
+    def test_read_of_closed_socket_sets_socket_close(self):
+        self.remote.close()
+        self.loop._read()
+        self.assertTrue(self.loop._events.is_set(events.SOCKET_CLOSE))
+        self.error_callback.assert_called_once_with('Connection reset')
+        self.read_callback.assert_not_called()
+
+    def test_read_error_invokes_error_callback(self):
+        self.local.setblocking(False)
+        self.loop._read()
+        self.assertFalse(self.loop._running)
+        self.assertTrue(self.error_callback.called)
+
+
+class IOLoopWriteTests(IOLoopTestCase):
+
+    def test_buffered_frames_are_sent_together(self):
+        self.loop._write_buffer.extend([b'foo', b'bar', b'baz'])
+        self.loop._write()
+        self.assertEqual(self.remote.recv(1024), b'foobarbaz')
+        self.write_callback.assert_called_once_with(9)
+        self.assertEqual(len(self.loop._write_buffer), 0)
+
+    def test_partial_write_keeps_unsent_bytes(self):
+        self.loop._fd = mock.Mock()
+        self.loop._fd.send.return_value = 2
+        self.loop._write_buffer.extend([b'foo', b'bar'])
+        self.loop._write()
+        self.write_callback.assert_called_once_with(2)
+        remainder = self.loop._write_buffer.popleft()
+        self.assertIsInstance(remainder, memoryview)
+        self.assertEqual(remainder.tobytes(), b'obar')
+
+    def test_partial_write_remainder_is_resent(self):
+        self.loop._write_buffer.append(memoryview(b'foobar')[2:])
+        self.loop._write_buffer.append(b'baz')
+        self.loop._write()
+        self.assertEqual(self.remote.recv(1024), b'obarbaz')
+
+    def test_write_is_limited_to_max_write(self):
+        chunk = b'x' * (io.MAX_WRITE // 2)
+        self.loop._write_buffer.extend([chunk, chunk, chunk])
+        self.assertEqual(self.loop._next_write(), chunk * 2)
+        self.assertEqual(list(self.loop._write_buffer), [chunk])
+
+    def test_frame_crossing_max_write_is_not_joined(self):
+        chunk = b'x' * io.MAX_WRITE
+        self.loop._write_buffer.extend([b'foo', chunk])
+        self.assertEqual(self.loop._next_write(), b'foo')
+        self.assertEqual(list(self.loop._write_buffer), [chunk])
+
+    def test_large_frame_is_not_copied(self):
+        chunk = b'x' * io.MAX_WRITE
+        self.loop._write_buffer.extend([chunk, b'foo'])
+        self.assertIs(self.loop._next_write(), chunk)
+
+
+class SelectorPollerTests(IOLoopTestCase):
+
+    def setUp(self):
+        super(SelectorPollerTests, self).setUp()
+        self.poller = self.loop._poller
+
+    def test_readable_socket_is_in_read_list(self):
+        self.remote.sendall(b'foo')
+        rlist, wlist = self.poller.poll(False)
+        self.assertEqual(rlist, [self.local.fileno()])
+        self.assertEqual(wlist, [])
+
+    def test_write_trigger_is_in_read_list(self):
+        self.trigger.send(b'0')
+        rlist, _wlist = self.poller.poll(False)
+        self.assertEqual(rlist, [self.listener.fileno()])
+
+    def test_writable_socket_is_in_write_list_when_wanted(self):
+        _rlist, wlist = self.poller.poll(True)
+        self.assertEqual(wlist, [self.local.fileno()])
+
+    def test_write_interest_is_removed(self):
+        self.poller.poll(True)
+        self.remote.sendall(b'foo')
+        _rlist, wlist = self.poller.poll(False)
+        self.assertEqual(wlist, [])
+
+    def test_closed_selector_returns_empty_lists(self):
+        self.poller.close()
+        self.assertEqual(self.poller.poll(False), ([], []))
+
+
+class IOLoopDrainWriteQueueTests(IOLoopTestCase):
+
+    def test_frames_are_moved_in_order(self):
+        write_queue = self.loop._write_queue
+        write_queue.extend([b'foo', b'bar', b'baz'])
+        self.loop._drain_write_queue()
+        self.assertEqual(len(write_queue), 0)
+        self.assertEqual(list(self.loop._write_buffer),
+                         [b'foo', b'bar', b'baz'])
+
+    def test_empty_queue_leaves_buffer_empty(self):
+        self.loop._drain_write_queue()
+        self.assertEqual(len(self.loop._write_buffer), 0)
+
+
+class IOLoopDrainWriteTriggerTests(IOLoopTestCase):
+
+    def setUp(self):
+        super(IOLoopDrainWriteTriggerTests, self).setUp()
+        self.listener.setblocking(False)
+
+    def test_all_trigger_bytes_are_read(self):
+        for _iteration in range(100):
+            self.trigger.send(b'0')
+        self.loop._drain_write_trigger()
+        self.assertRaises(socket.error, self.listener.recv, 1)
+
+    def test_empty_trigger_does_not_raise(self):
+        self.loop._drain_write_trigger()
+
+
+class GetFrameFromStrTests(unittest.TestCase):
+
+    def test_returns_channel_and_frame(self):
+        data = frame.marshal(specification.Basic.Ack(1), 1)
+        channel_id, value = io.IO._get_frame_from_str(data)
+        self.assertEqual(channel_id, 1)
+        self.assertIsInstance(value, specification.Basic.Ack)
+
+    def test_invalid_frame_returns_none(self):
+        data = bytearray(frame.marshal(specification.Basic.Ack(1), 1))
+        data[-1] = 0
+        self.assertEqual(io.IO._get_frame_from_str(bytes(data)),
+                         (None, None))
+
+
+@unittest.skipUnless(hasattr(os, 'eventfd'), 'eventfd is not available')
+class EventTriggerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.trigger = io._EventTrigger()
+        self.addCleanup(self.trigger.close)
+
+    def test_recv_returns_send_count(self):
+        self.trigger.send(b'0')
+        self.trigger.send(b'0')
+        self.assertEqual(self.trigger.recv(4096), 2)
+
+    def test_recv_without_send_raises(self):
+        self.assertRaises(socket.error, self.trigger.recv, 4096)
+
+    def test_close_sets_fileno(self):
+        self.trigger.close()
+        self.assertEqual(self.trigger.fileno(), -1)
+
+    def test_send_after_close_raises_socket_error(self):
+        self.trigger.close()
+        self.assertRaises(socket.error, self.trigger.send, b'0')
+
+    def test_io_uses_event_trigger(self):
+        value = io.IO(kwargs={'connection_args': {},
+                              'events': events.Events(),
+                              'exceptions': queue.Queue(),
+                              'write_queue': collections.deque()})
+        self.addCleanup(value._close)
+        self.assertIsInstance(value.write_trigger, io._EventTrigger)
+        self.assertIs(value.write_trigger, value._write_listener)
+
+    def test_trigger_wakes_selector_poller(self):
+        local, remote = socket.socketpair()
+        self.addCleanup(local.close)
+        self.addCleanup(remote.close)
+        poller = io._SelectorPoller(local, self.trigger)
+        self.addCleanup(poller.close)
+        self.trigger.send(b'0')
+        rlist, _wlist = poller.poll(False)
+        self.assertEqual(rlist, [self.trigger.fileno()])
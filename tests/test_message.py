@@ -11,6 +11,7 @@ import uuid
 
 import mock
 from pamqp import body
+from pamqp import frame
 from pamqp import header
 from pamqp import specification
 
@@ -504,3 +505,111 @@ class TestPublisherConfirms(helpers.TestCase):
         self._confirm_wait.return_value = specification.Basic.Consume()
         self.assertRaises(exceptions.UnexpectedResponseError,
                           self.msg.publish, self.EXCHANGE, self.ROUTING_KEY)
+
+
+class TestPublishMany(helpers.TestCase):
+
+    EXCHANGE = 'foo'
+    ROUTING_KEY = 'bar.baz'
+
+    def setUp(self):
+        super(TestPublishMany, self).setUp()
+        self.messages = [message.Message(self.channel, 'foo'),
+                         message.Message(self.channel, 'bar')]
+
+    def test_publish_many_writes_all_frames(self):
+        self.channel.publish_many(self.messages, self.EXCHANGE,
+                                  self.ROUTING_KEY)
+        frames = []
+        while self.channel._write_queue:
+            frames.append(frame.unmarshal(
+                self.channel._write_queue.popleft()))
+        self.assertEqual(len(frames), 6)
+        self.assertIsInstance(frames[3][2], specification.Basic.Publish)
+        self.assertEqual(frames[5][2].value, b'bar')
+
+    def test_publish_many_triggers_write_once(self):
+        self.channel.publish_many(self.messages, self.EXCHANGE,
+                                  self.ROUTING_KEY)
+        self.channel._write_trigger.send.assert_called_once_with(b'0')
+
+    def test_publish_many_without_confirms_returns_none(self):
+        self.assertIsNone(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+
+
+class TestPublishManyConfirms(helpers.TestCase):
+
+    EXCHANGE = 'foo'
+    ROUTING_KEY = 'bar.baz'
+
+    def setUp(self):
+        super(TestPublishManyConfirms, self).setUp()
+        self.channel._publisher_confirms = True
+        self.channel._wait_on_frame = self._wait_on_frame = mock.Mock()
+        self.messages = [message.Message(self.channel, 'foo'),
+                         message.Message(self.channel, 'bar')]
+
+    def test_multiple_ack_returns_true(self):
+        self._wait_on_frame.return_value = specification.Basic.Ack(2, True)
+        self.assertTrue(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+        self.assertEqual(self._wait_on_frame.call_count, 1)
+
+    def test_individual_acks_returns_true(self):
+        self._wait_on_frame.side_effect = [specification.Basic.Ack(1),
+                                           specification.Basic.Ack(2)]
+        self.assertTrue(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+
+    def test_nack_returns_false(self):
+        self._wait_on_frame.side_effect = [specification.Basic.Nack(1),
+                                           specification.Basic.Ack(2)]
+        self.assertFalse(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+
+    def test_other_response_raises(self):
+        self._wait_on_frame.return_value = specification.Basic.Consume()
+        self.assertRaises(exceptions.UnexpectedResponseError,
+                          self.channel.publish_many, self.messages,
+                          self.EXCHANGE, self.ROUTING_KEY)
+
+    def test_out_of_order_nack_returns_false(self):
+        self._wait_on_frame.side_effect = [specification.Basic.Ack(2),
+                                           specification.Basic.Nack(1)]
+        self.assertFalse(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+        self.assertEqual(self._wait_on_frame.call_count, 2)
+        self.assertEqual(self.channel._unconfirmed, set())
+
+    def test_out_of_order_acks_returns_true(self):
+        self._wait_on_frame.side_effect = [specification.Basic.Ack(2),
+                                           specification.Basic.Ack(1)]
+        self.assertTrue(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+        self.assertEqual(self._wait_on_frame.call_count, 2)
+
+    def test_second_batch_waits_on_its_own_tags(self):
+        self._wait_on_frame.side_effect = [specification.Basic.Ack(2, True),
+                                           specification.Basic.Ack(3),
+                                           specification.Basic.Nack(4)]
+        self.assertTrue(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+        self.assertFalse(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+
+    def test_generator_of_messages_is_confirmed(self):
+        self._wait_on_frame.return_value = specification.Basic.Ack(2, True)
+        self.assertTrue(self.channel.publish_many(
+            (msg for msg in self.messages), self.EXCHANGE, self.ROUTING_KEY))
+        self.assertEqual(self.channel._unconfirmed, set())
+
+    def test_message_publish_advances_delivery_tags(self):
+        self._wait_on_frame.side_effect = [specification.Basic.Ack(1),
+                                           specification.Basic.Ack(3),
+                                           specification.Basic.Ack(2)]
+        self.assertTrue(message.Message(self.channel, 'baz').publish(
+            self.EXCHANGE, self.ROUTING_KEY))
+        self.assertTrue(self.channel.publish_many(
+            self.messages, self.EXCHANGE, self.ROUTING_KEY))
+        self.assertEqual(self._wait_on_frame.call_count, 3)